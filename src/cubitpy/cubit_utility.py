@@ -21,9 +21,11 @@
 # THE SOFTWARE.
 """Utility functions for the use of cubitpy."""
 
+import numpy as np
+
 from cubitpy.conf import GeometryType, cupy
 from cubitpy.cubit_group import CubitGroup
-from cubitpy.cubit_wrapper.cubit_wrapper_host import CubitObject
+from cubitpy.cubit_wrapper.cubit_wrapper_host import NODE_IDS_CALL_INDEX, CubitObject
 
 
 def get_surface_center(surf):
@@ -40,6 +42,76 @@ def get_surface_center(surf):
     return surf.position_from_u_v(u, v)
 
 
+def get_surface_centers_and_normals(surfaces):
+    """Get the centers (see `get_surface_center`) of multiple surfaces and the
+    normals of the surfaces at these points.
+
+    All values are obtained from cubit with a single round trip.
+
+    Args
+    ----
+    surfaces: [CubitObject]
+        List of surfaces.
+
+    Return
+    ----
+    centers: np.ndarray
+        Array with the center of each surface in a row.
+    normals: np.ndarray
+        Array with the normal of each surface in a row.
+    """
+
+    if len(surfaces) == 0:
+        return np.zeros((0, 3)), np.zeros((0, 3))
+
+    calls = []
+    for surf in surfaces:
+        if not surf.get_geometry_type() == cupy.geometry.surface:
+            raise TypeError("Did not expect {}".format(type(surf)))
+        i = len(calls)
+        calls.extend(
+            [
+                (surf, "get_param_range_U", []),
+                (surf, "get_param_range_V", []),
+                (None, "range_center", ["{0}"], [i]),
+                (None, "range_center", ["{0}"], [i + 1]),
+                (surf, "position_from_u_v", ["{0}", "{1}"], [i + 2, i + 3]),
+                (surf, "normal_at", ["{0}"], [i + 4]),
+            ]
+        )
+    cubit_returns = surfaces[0].cubit_connect.send_batch(calls)
+    return np.array(cubit_returns[4::6]), np.array(cubit_returns[5::6])
+
+
+def get_sorted_node_ids(items):
+    """Get the sorted node IDs of multiple geometry items.
+
+    This uses the same calls as `CubitObject.get_node_ids`, but all
+    values are obtained from cubit with a single round trip.
+
+    Args
+    ----
+    items: [CubitObject]
+        List of geometry items, i.e., vertices, curves, surfaces or volumes.
+
+    Return
+    ----
+    node_ids: [np.ndarray]
+        For each item an array with the sorted node IDs.
+    """
+
+    if len(items) == 0:
+        return []
+
+    calls = []
+    node_ids_indices = []
+    for item in items:
+        node_ids_indices.append(len(calls) + NODE_IDS_CALL_INDEX)
+        calls.extend(item._node_ids_calls(len(calls)))
+    cubit_returns = items[0].cubit_connect.send_batch(calls)
+    return [np.sort(cubit_returns[i]) for i in node_ids_indices]
+
+
 def import_fluent_geometry(cubit, file, feature_angle=135):
     """Import fluent mesh geometry in cubit from file with according
     feature_angle."""
@@ -36,7 +36,9 @@ Note: The contents of `cubit_wrapper_utility.py` will be added to the start
     of this file during the setup of the remote process.
 """
 
+import json
 import os
+import struct
 import sys
 
 # Cubit constants
@@ -91,6 +93,10 @@ class DefaultMessageHandler:
         """Return two empty lists for messages and errors."""
         return [], []
 
+    def has_errors(self):
+        """Errors are not tracked by this class."""
+        return False
+
 
 message_handler = DefaultMessageHandler()
 
@@ -111,6 +117,136 @@ def channel_send(argument):
     )
 
 
+def numpy_array_to_list(item):
+    """Convert the raw data of a numpy array to nested lists.
+
+    The item has the form [NUMPY_ARRAY_PREFIX, dtype, shape, data].
+    """
+    _, dtype, shape, data = item
+    n_values = len(data) // int(dtype[2:])
+    values = list(
+        struct.unpack(dtype[0] + str(n_values) + NUMPY_STRUCT_FORMATS[dtype[1:]], data)
+    )
+
+    def reshape(values, shape):
+        """Split the flat list of values into nested lists."""
+        if len(shape) == 1:
+            return values
+        step = len(values) // shape[0]
+        return [
+            reshape(values[i * step : (i + 1) * step], shape[1:])
+            for i in range(shape[0])
+        ]
+
+    return reshape(values, shape)
+
+
+def deserialize_item(item):
+    """Deserialize the item, also if it contains nested nested lists."""
+    item_id = cubit_item_to_id(item)
+    if item_id is not None:
+        return cubit_objects[item_id]
+    elif is_numpy_array_data(item):
+        return numpy_array_to_list(item)
+    elif isinstance(item, tuple) or isinstance(item, list):
+        arguments = []
+        for sub_item in item:
+            arguments.append(deserialize_item(sub_item))
+        return arguments
+    else:
+        return item
+
+
+def serialize_cubit_return(cubit_return):
+    """Convert a return value from cubit to an item that can be sent to the
+    host."""
+    if is_base_type(cubit_return):
+        # The return item is a string, integer or float
+        return cubit_return
+
+    elif isinstance(cubit_return, tuple):
+        # A tuple was returned, loop over each entry and check its type
+        return_list = []
+        for item in cubit_return:
+            if is_base_type(item):
+                return_list.append(item)
+            elif is_cubit_type(item):
+                cubit_objects[id(item)] = item
+                return_list.append(object_to_id(item))
+            else:
+                raise TypeError(
+                    "Expected string, int, float or cubit object! Got {}!".format(item)
+                )
+        return return_list
+
+    elif is_cubit_type(cubit_return):
+        # Store the object locally and return the id
+        cubit_objects[id(cubit_return)] = cubit_return
+        return object_to_id(cubit_return)
+
+    else:
+        raise TypeError(
+            "Expected string, int, float, cubit object or tuple! Got {}!".format(
+                cubit_return
+            )
+        )
+
+
+def delete_cubit_object(item):
+    """Delete a cubit object from the dictionary of stored objects."""
+    cubit_id = cubit_item_to_id(item)
+    if cubit_id is None:
+        raise TypeError("Expected cubit object! Got {}!".format(item))
+
+    if cubit_id in cubit_objects.keys():
+        del cubit_objects[cubit_id]
+    else:
+        raise ValueError(
+            "The id {} is not in the cubit_objects dictionary".format(cubit_id)
+        )
+
+
+def substitute_dependencies(argument, dependency_values):
+    """Insert the return values of previous calls in a batch into an argument.
+
+    String arguments are formatted with the dependency values. If the
+    argument only consists of a single replacement field, e.g., "{0}",
+    it is replaced by the dependency value itself, so the type of the
+    value is kept.
+    """
+    if len(dependency_values) == 0 or not isinstance(argument, str):
+        return argument
+    if argument.startswith("{") and argument.endswith("}"):
+        index = argument[1:-1]
+        if index.isdigit():
+            return dependency_values[int(index)]
+    return argument.format(*dependency_values)
+
+
+def next_free_id(id_list):
+    """Return an ID that is larger than all IDs in the given list."""
+    return max([0] + list(id_list)) + 1
+
+
+def range_center(value_range):
+    """Return the center of a range given by its lower and upper bound."""
+    return 0.5 * (value_range[0] + value_range[1])
+
+
+def to_json(value):
+    """Return the given value as a JSON string, e.g., to return nested lists."""
+    return json.dumps(value)
+
+
+# Functions that can be called in a batch, e.g., to process the return value of
+# a previous call in the same batch without an additional round trip.
+batch_functions = {
+    "next_free_id": next_free_id,
+    "range_center": range_center,
+    "to_json": to_json,
+}
+
+
 # All cubit items that are created are stored in this dictionary. The keys are
 # the unique object ids. The items are deleted once they run out of scope in
 # the host interpreter.
@@ -174,6 +310,10 @@ try:
             self.setup()
             return return_value
 
+        def has_errors(self):
+            """Check if errors were stored since the last call to pop."""
+            return len(self.errors) > 0
+
         def print_message(self, message):
             """Append the message to the list of messages."""
             self.messages.append(message)
@@ -201,14 +341,25 @@ while 1:
     if receive is None:
         break
 
+    # Objects that ran out of scope in the host are deleted together with the
+    # next call, i.e., ['with_deletes', [[cubit_object], ...], receive]
+    if receive[0] == "with_deletes":
+        for item in receive[1]:
+            delete_cubit_object(item)
+        receive = receive[2]
+
     # The first argument decides that functionality will be performed:
     # 'cubit_object': return an attribute of a cubit object. If the attribute is
     #       callable, it is executed with the given arguments.
     #       [[cubit_object], 'name', ['arguments']]
     # 'iscallable': Check if a name is callable or not
+    # 'getattr_probe': Check if a name is callable, if not, also return the value
     # 'isinstance': Check if the cubit object is of a certain instance
     # 'get_self_dir': Return the attributes in a cubit_object
     # 'delete': Delete the cubit object from the dictionary
+    # 'delete_batch': Delete multiple cubit objects from the dictionary
+    # 'get_object_count': Return the number of stored cubit objects
+    # 'batch': Perform multiple calls to cubit objects in a single round trip.
     # 'get_temp_dir': Get the temporary directory that is accessible by Cubit.
     # 'display_in_cubit': Launch cubit in the GUI.
 
@@ -220,20 +371,6 @@ while 1:
         call_object = cubit_objects[cubit_item_to_id(receive[0])]
         name = receive[1]
 
-        def deserialize_item(item):
-            """Deserialize the item, also if it contains nested nested
-            lists."""
-            item_id = cubit_item_to_id(item)
-            if item_id is not None:
-                return cubit_objects[item_id]
-            elif isinstance(item, tuple) or isinstance(item, list):
-                arguments = []
-                for sub_item in item:
-                    arguments.append(deserialize_item(sub_item))
-                return arguments
-            else:
-                return item
-
         if callable(getattr(call_object, name)):
             # Call the function
             arguments = deserialize_item(receive[2])
@@ -242,44 +379,46 @@ while 1:
             # Get the attribute value
             cubit_return = call_object.__getattribute__(name)
 
-        # Check what to return
-        if is_base_type(cubit_return):
-            # The return item is a string, integer or float
-            channel_send(cubit_return)
-
-        elif isinstance(cubit_return, tuple):
-            # A tuple was returned, loop over each entry and check its type
-            return_list = []
-            for item in cubit_return:
-                if is_base_type(item):
-                    return_list.append(item)
-                elif is_cubit_type(item):
-                    cubit_objects[id(item)] = item
-                    return_list.append(object_to_id(item))
-                else:
-                    raise TypeError(
-                        "Expected string, int, float or cubit object! Got {}!".format(
-                            item
-                        )
-                    )
-            channel_send(return_list)
-
-        elif is_cubit_type(cubit_return):
-            # Store the object locally and return the id
-            cubit_objects[id(cubit_return)] = cubit_return
-            channel_send(object_to_id(cubit_return))
-
-        else:
-            raise TypeError(
-                "Expected string, int, float, cubit object or tuple! Got {}!".format(
-                    cubit_return
+        channel_send(serialize_cubit_return(cubit_return))
+
+    elif receive[0] == "batch":
+        # Perform multiple calls with a single round trip to the host. Each call
+        # has the form [[cubit_object], 'name', ['arguments'], [dependencies]].
+        # If the cubit object is None, 'name' refers to a function in
+        # batch_functions. The batch is stopped at the first call that raises
+        # an error in cubit.
+        cubit_returns = []
+        for call_item, name, arguments, dependencies in receive[1]:
+            dependency_values = [cubit_returns[i] for i in dependencies]
+            arguments = [
+                substitute_dependencies(argument, dependency_values)
+                for argument in deserialize_item(arguments)
+            ]
+            if call_item is None:
+                call_function = batch_functions[name]
+            else:
+                call_function = getattr(
+                    cubit_objects[cubit_item_to_id(call_item)], name
                 )
-            )
+            cubit_returns.append(call_function(*arguments))
+            if message_handler.has_errors():
+                break
+
+        channel_send([serialize_cubit_return(item) for item in cubit_returns])
 
     elif receive[0] == "iscallable":
         cubit_object = cubit_objects[cubit_item_to_id(receive[1])]
         channel_send(callable(getattr(cubit_object, receive[2])))
 
+    elif receive[0] == "getattr_probe":
+        # Check if a name is callable, if not, also return the value
+        cubit_object = cubit_objects[cubit_item_to_id(receive[1])]
+        attribute = getattr(cubit_object, receive[2])
+        if callable(attribute):
+            channel_send([True, None])
+        else:
+            channel_send([False, serialize_cubit_return(attribute)])
+
     elif receive[0] == "get_object_type":
         # Get the type of the cubit object
         compare_object = cubit_objects[cubit_item_to_id(receive[1])]
@@ -307,22 +446,23 @@ while 1:
         )
 
     elif receive[0] == "delete":
-        # Get the id of the object to delete
-        cubit_id = cubit_item_to_id(receive[1])
-        if cubit_id is None:
-            raise TypeError("Expected cubit object! Got {}!".format(item))
-
         # Delete the object from the dictionary.
-        if cubit_id in cubit_objects.keys():
-            del cubit_objects[cubit_id]
-        else:
-            raise ValueError(
-                "The id {} is not in the cubit_objects dictionary".format(cubit_id)
-            )
+        delete_cubit_object(receive[1])
+
+        # Return to python host
+        channel_send(None)
+
+    elif receive[0] == "delete_batch":
+        # Delete multiple objects from the dictionary.
+        for item in receive[1]:
+            delete_cubit_object(item)
 
         # Return to python host
         channel_send(None)
 
+    elif receive[0] == "get_object_count":
+        channel_send(len(cubit_objects))
+
     elif receive[0] == "get_temp_dir":
         channel_send(temp_dir.name)
 
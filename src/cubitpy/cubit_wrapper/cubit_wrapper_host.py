@@ -23,15 +23,110 @@
 interpreter and the main python interpreter."""
 
 import atexit
+import codecs
+import itertools
+import numbers
 import os
 import warnings
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 import execnet
 import numpy as np
 
 from cubitpy.conf import CubitPyWarning, GeometryType, cupy
-from cubitpy.cubit_wrapper.cubit_wrapper_utility import cubit_item_to_id, is_base_type
+from cubitpy.cubit_wrapper.cubit_wrapper_utility import (
+    NUMPY_ARRAY_PREFIX,
+    NUMPY_STRUCT_FORMATS,
+    cubit_item_to_id,
+    is_base_type,
+)
+
+# Counter used to give each connection its own cubit log file.
+_LOG_FILE_COUNTER = itertools.count()
+
+# Number of objects marked for deletion after which they are sent to the client
+# without waiting for the next call.
+_MAX_PENDING_DELETES = 1000
+
+# Numpy dtypes that are sent to the client as raw data.
+_NUMPY_RAW_DTYPES = frozenset(np.dtype(dtype) for dtype in NUMPY_STRUCT_FORMATS)
+
+
+@lru_cache(maxsize=None)
+def _get_client_code():
+    """Return the code to be executed in the client interpreter.
+
+    This code also has to contain the utility functions. The files are
+    only read once per session.
+    """
+    path_client_utils = Path(__file__).parent / "cubit_wrapper_utility.py"
+    path_client_code = Path(__file__).parent / "cubit_wrapper_client.py"
+    return path_client_utils.read_text() + "\n" + path_client_code.read_text()
+
+
+def _serialize_sequence(item):
+    """Serialize the entries of a list or tuple."""
+    return [serialize_item(sub_item) for sub_item in item]
+
+
+def _serialize_numpy_array(item):
+    """Serialize a numpy array.
+
+    Arrays with a supported dtype are sent as raw data, which is much
+    smaller and faster than nested lists of python numbers.
+    """
+    if item.size > 0 and item.ndim > 0 and item.dtype in _NUMPY_RAW_DTYPES:
+        return [NUMPY_ARRAY_PREFIX, item.dtype.str, list(item.shape), item.tobytes()]
+    return item.tolist()
+
+
+def _serialize_other(item):
+    """Serialize an item whose type is not in _SERIALIZE_FUNCTIONS."""
+    if isinstance(item, CubitObject):
+        return item.cubit_id
+    elif isinstance(item, tuple) or isinstance(item, list):
+        return _serialize_sequence(item)
+    elif isinstance(item, numbers.Integral):
+        return int(item)
+    elif isinstance(item, numbers.Real):
+        return float(item)
+    elif isinstance(item, cupy.geometry):
+        return item.get_cubit_string()
+    elif isinstance(item, np.ndarray):
+        return _serialize_numpy_array(item)
+    else:
+        return item
+
+
+# Methods that are not waited for inside of `CubitConnect.pipeline`.
+_PIPELINE_METHODS = {"cmd", "silent_cmd"}
+
+# Types that are sent to the client without conversion. bool is not part of
+# this, since it is converted to int.
+_PLAIN_TYPES = frozenset([str, int, float, type(None)])
+
+# Functions to serialize items sent to the client, depending on the exact type of
+# the item. Items of other types are serialized with _serialize_other.
+_SERIALIZE_FUNCTIONS = {
+    str: lambda item: item,
+    int: lambda item: item,
+    float: lambda item: item,
+    bool: int,
+    type(None): lambda item: item,
+    list: _serialize_sequence,
+    tuple: _serialize_sequence,
+    np.ndarray: _serialize_numpy_array,
+    GeometryType: GeometryType.get_cubit_string,
+}
+
+
+def serialize_item(item):
+    """Serialize an item that is sent to the client, also nested lists."""
+    serialize_function = _SERIALIZE_FUNCTIONS.get(type(item), _serialize_other)
+    return serialize_function(item)
 
 
 class CubitConnect(object):
@@ -55,6 +150,29 @@ class CubitConnect(object):
             Python interpreter to be used for running cubit.
         """
 
+        # Objects in the client that are no longer referenced in this
+        # interpreter. They are deleted together with the next call to the
+        # client.
+        self._pending_deletes = []
+
+        # Store if the attributes of cubit objects are callable. The keys are
+        # the class names of the objects in the client, the values are
+        # dictionaries with the attribute names as keys.
+        self._callable_cache = {}
+
+        # Results of get_self_dir, the keys are the class names of the objects
+        # in the client.
+        self._self_dir_cache = {}
+
+        # Calls that were sent to the client, but whose return values were not
+        # yet received.
+        self._inflight = deque()
+        self._pipeline_depth = 0
+
+        # File descriptor of the cubit log file, it is opened after cubit is
+        # initialized.
+        self._log_fd = None
+
         # Set up the gateway to the client python interpreter
         if cupy.is_remote():
             interpreter = f"ssh={cupy.get_remote_user()}@{cupy.get_remote_host()}//python={cupy.get_cubit_python_interpreter()}"
@@ -68,16 +186,8 @@ class CubitConnect(object):
         self.gw = execnet.makegateway(interpreter)
         self.gw.reconfigure(py3str_as_py2str=True)
 
-        # Get the code to be executed in the client interpreter. This code also has to
-        # contain the utility functions.
-        path_client_utils = Path(__file__).parent / "cubit_wrapper_utility.py"
-        path_client_code = Path(__file__).parent / "cubit_wrapper_client.py"
-        client_code = (
-            path_client_utils.read_text() + "\n" + path_client_code.read_text()
-        )
-
         # Set up the connection channel
-        self.channel = self.gw.remote_exec(client_code)
+        self.channel = self.gw.remote_exec(_get_client_code())
 
         # Arguments for cubit
         if cubit_args is None:
@@ -105,20 +215,22 @@ class CubitConnect(object):
 
         # Local mode – run cubit on the local machine
         else:
-            # Check if a log file was given in the cubit arguments
-            for arg in arguments:
-                if arg.startswith("-log="):
-                    log_given = True
-                    break
-            else:
-                log_given = False
+            # Check if a log file was given in the cubit arguments, either as
+            # "-log=file" or as "-log file"
+            log_given = any(
+                arg == "-log" or arg.startswith("-log=") for arg in arguments
+            )
 
             self.log_check = False
 
             if not log_given:
-                # Write the log to a temporary file and check the contents after each call to cubit
-                arguments.extend(["-log", cupy.temp_log])
-                parameters["tty"] = cupy.temp_log
+                # Write the log to a temporary file and check the contents after each call to cubit.
+                # Each connection has its own log file, so the output of other connections is not
+                # printed here.
+                log_root, log_extension = os.path.splitext(cupy.temp_log)
+                self._log_path = f"{log_root}_{next(_LOG_FILE_COUNTER)}{log_extension}"
+                arguments.extend(["-log", self._log_path])
+                parameters["tty"] = self._log_path
                 self.log_check = True
 
         # Send the parameters to the client interpreter
@@ -133,11 +245,24 @@ class CubitConnect(object):
             )
         self.cubit = CubitObjectMain(self, cubit_id)
 
+        if self.log_check:
+            # Keep the log file open and only read the content that is added
+            # after the initialization. The new content is printed after each
+            # call to cubit.
+            self._log_fd = os.open(self._log_path, os.O_RDONLY | os.O_CREAT)
+            self._log_offset = os.fstat(self._log_fd).st_size
+            self._log_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
         def cleanup_execnet_gateway():
             """We need to register a function called at interpreter shutdown
             that ensures that the execnet connection is closed first,
             otherwise, we get a runtime error during shutdown."""
+            self.flush_deletes()
             self.cubit.cubit_connect.gw.exit()
+            if self.log_check:
+                self._print_log()
+                os.close(self._log_fd)
+                os.remove(self._log_path)
 
         atexit.register(cleanup_execnet_gateway)
 
@@ -152,28 +277,12 @@ class CubitConnect(object):
             arguments stored in the second entry in argument_list.
         """
 
-        def get_log_string(log_lines: list[str], name: str) -> str:
-            """Get a string from the log lines."""
-            text = f"The command\n    {argument_list}\nraised the following {name}:"
-            return "\n".join([text] + log_lines)
-
         try:
-            self.channel.send(argument_list)
-            return_value = self.channel.receive()
-            if isinstance(return_value, dict):
-                if len(return_value["messages"]) > 0:
-                    warnings.warn(
-                        get_log_string(return_value["messages"], "message(s)"),
-                        category=CubitPyWarning,
-                        stacklevel=3,
-                    )
-                if len(return_value["errors"]) > 0:
-                    raise RuntimeError(
-                        get_log_string(return_value["errors"], "error(s)")
-                    )
-                return return_value["return_value"]
-            else:
-                return return_value
+            # All previous calls have to be finished before this one. Warnings
+            # are shown for the caller of the function that calls this method.
+            self.drain(stacklevel=3)
+            self.send_async(argument_list)
+            return self._receive(stacklevel=3)
         except OSError as e:
             if "cannot send" in str(e):
                 # If the channel is already finalized we get this error here. This
@@ -182,6 +291,144 @@ class CubitConnect(object):
                 return None
             raise
 
+    def send_async(self, argument_list):
+        """Send arguments to the python client without waiting for the return
+        value.
+
+        The return values are collected with `drain`.
+
+        Args
+        ----
+        argument_list: list
+            See `send_and_return`.
+        """
+
+        # Send the pending deletes along with this call. They are only removed
+        # from the list once the message is sent.
+        n_deletes = len(self._pending_deletes)
+        message = argument_list
+        if n_deletes > 0:
+            message = [
+                "with_deletes",
+                self._pending_deletes[:n_deletes],
+                argument_list,
+            ]
+
+        self.channel.send(message)
+        self._inflight.append(argument_list)
+        del self._pending_deletes[:n_deletes]
+
+    def drain(self, stacklevel=1):
+        """Wait for all calls sent with `send_async` to finish.
+
+        If any of these calls raised errors in cubit, the first one is
+        raised after all return values are collected.
+
+        Args
+        ----
+        stacklevel: int
+            Stack level of the warnings for messages from cubit, relative to
+            the caller of this method, see `warnings.warn`.
+        """
+
+        error = None
+        while len(self._inflight) > 0:
+            try:
+                self._receive(stacklevel=stacklevel + 1)
+            except RuntimeError as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+
+    def _receive(self, stacklevel=1):
+        """Receive the return value of the oldest call in flight and check it
+        for messages and errors from cubit.
+
+        Args
+        ----
+        stacklevel: int
+            Stack level of the warnings for messages from cubit, relative to
+            the caller of this method, see `warnings.warn`.
+        """
+
+        argument_list = self._inflight.popleft()
+
+        def get_log_string(log_lines: list[str], name: str) -> str:
+            """Get a string from the log lines."""
+            text = f"The command\n    {argument_list}\nraised the following {name}:"
+            return "\n".join([text] + log_lines)
+
+        return_value = self.channel.receive()
+        self._print_log()
+        if isinstance(return_value, dict):
+            if len(return_value["messages"]) > 0:
+                warnings.warn(
+                    get_log_string(return_value["messages"], "message(s)"),
+                    category=CubitPyWarning,
+                    stacklevel=stacklevel + 1,
+                )
+            if len(return_value["errors"]) > 0:
+                raise RuntimeError(get_log_string(return_value["errors"], "error(s)"))
+            return return_value["return_value"]
+        else:
+            return return_value
+
+    @contextmanager
+    def pipeline(self):
+        """Context manager in which calls to methods that do not return a
+        value, e.g., `cmd`, are sent to the client without waiting for them
+        to finish.
+
+        These calls return None. All other calls, and leaving the context,
+        wait for the sent calls to finish. Errors in the sent calls are
+        raised at that point.
+        """
+
+        self._pipeline_depth += 1
+        try:
+            yield
+        finally:
+            self._pipeline_depth -= 1
+            if self._pipeline_depth == 0:
+                # The frames above this one are the __exit__ method of the
+                # context manager and the with statement.
+                self.drain(stacklevel=3)
+
+    def invalidate_introspection_cache(self):
+        """Clear the cached information about the attributes of the cubit
+        classes.
+
+        This is only required if the attributes of cubit classes change
+        during runtime, e.g., when loading plugins.
+        """
+        self._callable_cache = {}
+        self._self_dir_cache = {}
+
+    def delete_later(self, cubit_id):
+        """Mark an object in the client for deletion.
+
+        The object is deleted together with the next call to the
+        client, so no additional round trip is required. If too many
+        objects are marked, they are sent to the client without waiting
+        for the reply.
+        """
+        self._pending_deletes.append(cubit_id)
+        if len(self._pending_deletes) >= _MAX_PENDING_DELETES:
+            try:
+                self.send_async(["delete_batch", []])
+            except OSError as e:
+                # The connection is already closed, see send_and_return.
+                if "cannot send" not in str(e):
+                    raise
+
+    def flush_deletes(self):
+        """Delete all objects in the client that are marked for
+        deletion."""
+        if len(self._pending_deletes) > 0:
+            # The marked objects are sent along with an empty delete batch.
+            self.send_and_return(["delete_batch", []])
+
     def get_attribute(self, cubit_object, name):
         """Return the attribute 'name' of cubit_object. If the attribute is
         callable a function is returned, otherwise the attribute value is
@@ -198,79 +445,141 @@ class CubitConnect(object):
         def function(*args):
             """This function gets returned from the parent method."""
 
-            def serialize_item(item):
-                """Serialize an item, also nested lists."""
-
-                if isinstance(item, tuple) or isinstance(item, list):
-                    arguments = []
-                    for sub_item in item:
-                        arguments.append(serialize_item(sub_item))
-                    return arguments
-                elif isinstance(item, CubitObject):
-                    return item.cubit_id
-                elif isinstance(item, float):
-                    return float(item)
-                elif isinstance(item, int):
-                    return int(item)
-                elif isinstance(item, cupy.geometry):
-                    return item.get_cubit_string()
-                elif isinstance(item, np.ndarray):
-                    return item.tolist()
-                else:
-                    return item
-
-            if self.log_check:
-                # Check if the log file is empty. If it is not, empty it.
-                if os.stat(cupy.temp_log).st_size != 0:
-                    with open(cupy.temp_log, "w"):
-                        pass
+            # Check if there are cubit objects in the arguments. Most calls
+            # only have arguments that can be sent without conversion.
+            if all(type(arg) in _PLAIN_TYPES for arg in args):
+                arguments = list(args)
+            else:
+                arguments = serialize_item(args)
 
-            # Check if there are cubit objects in the arguments
-            arguments = serialize_item(args)
+            # In a pipeline, calls without a return value are not waited for
+            if self._pipeline_depth > 0 and name in _PIPELINE_METHODS:
+                self.send_async([cubit_object.cubit_id, name, arguments])
+                return None
 
             # Call the method on the cubit object
             cubit_return = self.send_and_return(
                 [cubit_object.cubit_id, name, arguments]
             )
-
-            if self.log_check:
-                # Print the content of the log file
-                with open(cupy.temp_log, "r") as log_file:
-                    print(log_file.read(), end="")
-
-            # Check if the return value is a cubit object
-            if cubit_item_to_id(cubit_return) is not None:
-                return CubitObject(self, cubit_return)
-            elif isinstance(cubit_return, list):
-                # If the return value is a list, check if any entry of the list
-                # is a cubit object
-                return_list = []
-                for item in cubit_return:
-                    if cubit_item_to_id(item) is not None:
-                        return_list.append(CubitObject(self, item))
-                    elif is_base_type(item):
-                        return_list.append(item)
-                    else:
-                        raise TypeError(
-                            "Expected cubit object, or base_type, "
-                            + "got {}!".format(item)
-                        )
-                return return_list
-            elif is_base_type(cubit_return):
-                return cubit_return
-            else:
-                raise TypeError(
-                    "Expected cubit object, or base_type, "
-                    + "got {}!".format(cubit_return)
-                )
+            return self.convert_cubit_return(cubit_return)
+
+        # Whether an attribute is callable only depends on the class of the
+        # object in the client, so this information is cached.
+        class_cache = self._callable_cache.setdefault(cubit_object.cubit_id[2], {})
+        if name not in class_cache:
+            # Check if the attribute is callable. If it is not, the value is
+            # returned with the same call.
+            is_callable, value = self.send_and_return(
+                ["getattr_probe", cubit_object.cubit_id, name]
+            )
+            class_cache[name] = is_callable
+            if not is_callable:
+                return self.convert_cubit_return(value)
 
         # Depending on the type of attribute, return the attribute value or a
         # callable function
-        if self.send_and_return(["iscallable", cubit_object.cubit_id, name]):
+        if class_cache[name]:
             return function
         else:
             return function()
 
+    def send_batch(self, calls):
+        """Perform multiple calls in the client with a single round trip.
+
+        Args
+        ----
+        calls: [(CubitObject, str, list, [int])]
+            Each call is given by the object the method is called on, the name
+            of the method, the arguments and optionally a list of indices of
+            previous calls in this batch. String arguments are formatted with
+            the return values of these previous calls, an argument that only
+            consists of a single replacement field, e.g., "{0}", is replaced by
+            the return value itself. If the object is None, the method name
+            refers to a function in `batch_functions` of the client. The
+            calls after the first one that raises an error in cubit are not
+            performed, the error is raised after the batch.
+
+        Return
+        ----
+        A list with the return values of all calls.
+        """
+
+        batch = []
+        for call in calls:
+            call_object, name, arguments = call[:3]
+            dependencies = call[3] if len(call) > 3 else []
+            batch.append(
+                [
+                    None if call_object is None else call_object.cubit_id,
+                    name,
+                    serialize_item(arguments),
+                    dependencies,
+                ]
+            )
+
+        cubit_returns = self.send_and_return(["batch", batch])
+
+        return [self.convert_cubit_return(item) for item in cubit_returns]
+
+    def convert_cubit_return(self, cubit_return):
+        """Convert a return value from the client, i.e., create the linking
+        objects for cubit objects."""
+
+        # Check if the return value is a cubit object
+        if cubit_item_to_id(cubit_return) is not None:
+            return CubitObject(self, cubit_return)
+        elif isinstance(cubit_return, list):
+            # If the return value is a list, check if any entry of the list
+            # is a cubit object
+            to_id = cubit_item_to_id
+            base_type = is_base_type
+            return_list = []
+            for item in cubit_return:
+                if to_id(item) is not None:
+                    return_list.append(CubitObject(self, item))
+                elif base_type(item):
+                    return_list.append(item)
+                else:
+                    raise TypeError(
+                        "Expected cubit object, or base_type, " + "got {}!".format(item)
+                    )
+            return return_list
+        elif is_base_type(cubit_return):
+            return cubit_return
+        else:
+            raise TypeError(
+                "Expected cubit object, or base_type, " + "got {}!".format(cubit_return)
+            )
+
+    def _print_log(self):
+        """Print the content that was added to the log file since the last
+        call to this function."""
+        if self._log_fd is not None:
+            log_bytes = b""
+            while True:
+                data = os.pread(self._log_fd, 65536, self._log_offset + len(log_bytes))
+                log_bytes += data
+                if len(data) < 65536:
+                    break
+            if len(log_bytes) > 0:
+                self._log_offset += len(log_bytes)
+                print(self._log_decoder.decode(log_bytes), end="")
+
+
+# Object types of the cubit classes, the keys are the class names in the
+# client.
+_CLASS_NAME_TO_OBJECT_TYPE = {
+    "Vertex": cupy.geometry.vertex,
+    "Curve": cupy.geometry.curve,
+    "Surface": cupy.geometry.surface,
+    "Volume": cupy.geometry.volume,
+    "Body": "body",
+}
+
+
+# Index of the call that returns the node IDs in `CubitObject._node_ids_calls`.
+NODE_IDS_CALL_INDEX = 4
+
 
 class CubitObject(object):
     """This class holds a link to a cubit object in the client.
@@ -279,6 +588,10 @@ class CubitObject(object):
     client.
     """
 
+    # Many of these objects are created, so they do not get an instance
+    # dictionary.
+    __slots__ = ("cubit_connect", "cubit_id")
+
     def __init__(self, cubit_connect: CubitConnect, cubit_data_list: list):
         """Initialize the object.
 
@@ -311,6 +624,11 @@ class CubitObject(object):
         try:
             return object.__getattribute__(self, name, *args, **kwargs)
         except AttributeError:
+            # Private and special names are not looked up in the client. They
+            # are usually probes from python itself, e.g., from copy, pickle
+            # or IPython.
+            if name.startswith("_"):
+                raise
             return self.cubit_connect.get_attribute(self, name)
 
     def __eq__(self, other):
@@ -332,19 +650,34 @@ class CubitObject(object):
 
     def __del__(self):
         """When this object is deleted, the object in the client can also be
-        deleted."""
-        self.cubit_connect.send_and_return(["delete", self.cubit_id])
+        deleted.
+
+        The deletion is deferred until the next call to the client.
+        """
+        self.cubit_connect.delete_later(self.cubit_id)
 
     def __str__(self):
         """Return the string from the client."""
         return '<CubitObject>"' + self.cubit_id[1] + '"'
 
+    def __repr__(self):
+        """Return the string from the client."""
+        return self.__str__()
+
     def get_self_dir(self):
         """Return a list of all cubit child items of this object.
 
-        Also return a flag if the child item is callable or not.
+        Also return a flag if the child item is callable or not. The
+        result only depends on the class of the object in the client,
+        so it is cached.
         """
-        return self.cubit_connect.send_and_return(["get_self_dir", self.cubit_id])
+        self_dir_cache = self.cubit_connect._self_dir_cache
+        class_name = self.cubit_id[2]
+        if class_name not in self_dir_cache:
+            self_dir_cache[class_name] = self.cubit_connect.send_and_return(
+                ["get_self_dir", self.cubit_id]
+            )
+        return list(self_dir_cache[class_name])
 
     def get_methods(self):
         """Return a list of all callable cubit methods for this object."""
@@ -356,6 +689,13 @@ class CubitObject(object):
 
     def get_object_type(self):
         """Return the type of this object."""
+
+        # The class name of the object in the client is known, so the type
+        # can be determined without a call to the client in most cases.
+        object_type = _CLASS_NAME_TO_OBJECT_TYPE.get(self.cubit_id[2])
+        if object_type is not None:
+            return object_type
+
         string_representation = self.cubit_connect.send_and_return(
             ["get_object_type", self.cubit_id]
         )
@@ -385,39 +725,60 @@ class CubitObject(object):
         else:
             return object_type
 
-    def get_node_ids(self):
-        """Return a list with the node IDs (index 1) of this object.
+    def _node_ids_calls(self, offset=0):
+        """Return the calls for `CubitConnect.send_batch` that get the node
+        IDs of this object.
 
         This is done by creating a temporary node set that this geometry
         is added to. It is not possible to get the node list directly
         from cubit.
-        """
 
-        # Get a node set ID that is not yet taken
-        node_set_ids = [0]
-        node_set_ids.extend(self.cubit_connect.cubit.get_nodeset_id_list())
-        temp_node_set_id = max(node_set_ids) + 1
+        Args
+        ----
+        offset: int
+            Index of the first of these calls in the batch.
 
-        # Add a temporary node set with this geometry
-        self.cubit_connect.cubit.cmd(
-            "nodeset {} {} {}".format(
-                temp_node_set_id, self.get_geometry_type().get_cubit_string(), self.id()
-            )
-        )
+        Return
+        ----
+        A list with the calls, the node IDs are the return value of the call
+        with the index `offset + NODE_IDS_CALL_INDEX`.
+        """
 
-        # Get the nodes in the created node set
-        node_ids = self.cubit_connect.cubit.get_nodeset_nodes_inclusive(
-            temp_node_set_id
-        )
+        cubit = self.cubit_connect.cubit
+        geometry_string = self.get_geometry_type().get_cubit_string()
+        return [
+            # Get a node set ID that is not yet taken
+            (cubit, "get_nodeset_id_list", []),
+            (None, "next_free_id", ["{0}"], [offset]),
+            (self, "id", []),
+            # Add a temporary node set with this geometry
+            (
+                cubit,
+                "cmd",
+                [f"nodeset {{0}} {geometry_string} {{1}}"],
+                [offset + 1, offset + 2],
+            ),
+            # Get the nodes in the created node set
+            (cubit, "get_nodeset_nodes_inclusive", ["{0}"], [offset + 1]),
+            # Delete the temp node set
+            (cubit, "cmd", ["delete nodeset {0}"], [offset + 1]),
+        ]
 
-        # Delete the temp node set and return the node list
-        self.cubit_connect.cubit.cmd("delete nodeset {}".format(temp_node_set_id))
-        return node_ids
+    def get_node_ids(self):
+        """Return a list with the node IDs (index 1) of this object.
+
+        All calls are performed in a single round trip to the client,
+        see `_node_ids_calls`.
+        """
+        cubit_returns = self.cubit_connect.send_batch(self._node_ids_calls())
+        return cubit_returns[NODE_IDS_CALL_INDEX]
 
 
 class CubitObjectMain(CubitObject):
     """The main cubit object will be of this type, it can not delete itself."""
 
+    __slots__ = ()
+
     def __del__(self):
         """Overwrite the default, because we don't want to delete any objects
         on the client if this main object is deleted."""
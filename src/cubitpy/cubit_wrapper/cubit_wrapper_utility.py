@@ -22,40 +22,52 @@
 """Utility functions for the cubit wrapper."""
 
 CUBIT_OBJECT_PREFIX = "cubitpy_object_"
+CUBIT_OBJECT_PREFIX_LENGTH = len(CUBIT_OBJECT_PREFIX)
+
+# Numpy arrays are sent to the client as a list with this prefix, followed by
+# the dtype string, the shape and the raw data of the array.
+NUMPY_ARRAY_PREFIX = "cubitpy_numpy_array"
+
+# Formats for the struct module of the numpy dtypes that are sent as raw data.
+NUMPY_STRUCT_FORMATS = {"f4": "f", "f8": "d", "i4": "i", "i8": "q"}
+
+# Types that do not need conversion for the connection between the different
+# python interpreters.
+BASE_TYPES = frozenset([str, int, float, bool, type(None)])
 
 
 def object_to_id(obj):
     """Return list representing the cubit object.
 
     The first entry is the python id of the object, the second entry is
-    the string representation.
+    the string representation and the third entry is the name of the
+    class of the object.
     """
-    return [CUBIT_OBJECT_PREFIX + str(id(obj)), str(obj)]
+    return [CUBIT_OBJECT_PREFIX + str(id(obj)), str(obj), obj.__class__.__name__]
 
 
 def cubit_item_to_id(cubit_data_list):
-    """Return the id from a cubit data list."""
-    if not isinstance(cubit_data_list, list):
-        return None
-    if len(cubit_data_list) == 0:
-        return None
-    if not isinstance(cubit_data_list[0], str):
-        return None
-    if cubit_data_list[0].startswith(CUBIT_OBJECT_PREFIX):
-        return int(cubit_data_list[0][len(CUBIT_OBJECT_PREFIX) :])
-    else:
-        return None
+    """Return the id from a cubit data list.
+
+    This function is called for every item returned from cubit, so the
+    checks are kept as cheap as possible.
+    """
+    if (
+        type(cubit_data_list) is list
+        and cubit_data_list
+        and type(cubit_data_list[0]) is str
+        and cubit_data_list[0][:CUBIT_OBJECT_PREFIX_LENGTH] == CUBIT_OBJECT_PREFIX
+    ):
+        return int(cubit_data_list[0][CUBIT_OBJECT_PREFIX_LENGTH:])
+    return None
+
+
+def is_numpy_array_data(item):
+    """Check if the item contains the raw data of a numpy array."""
+    return type(item) is list and len(item) == 4 and item[0] == NUMPY_ARRAY_PREFIX
 
 
 def is_base_type(obj):
     """Check if the object is of a base type that does not need conversion for
     the connection between the different python interpreters."""
-    if (
-        isinstance(obj, str)
-        or isinstance(obj, int)
-        or isinstance(obj, float)
-        or isinstance(obj, type(None))
-    ):
-        return True
-    else:
-        return False
+    return type(obj) in BASE_TYPES
@@ -28,6 +28,7 @@ import warnings
 from dataclasses import dataclass
 from pathlib import Path, PureWindowsPath
 
+import numpy as np
 from fourcipp.fourc_input import FourCInput
 
 from cubitpy.conf import CubitPyWarning, GeometryType, cupy
@@ -41,6 +42,17 @@ from cubitpy.cubit_utility import node_set_info_to_string
 from cubitpy.cubit_wrapper.cubit_wrapper_file_transfer import transfer_file_from_remote
 from cubitpy.cubit_wrapper.cubit_wrapper_host import CubitConnect
 
+# Number of nodes in the connectivity returned by cubit for each element type.
+_CONNECTIVITY_NODE_COUNTS = {
+    "edge": 2,
+    "tri": 3,
+    "quad": 4,
+    "tet": 4,
+    "pyramid": 5,
+    "wedge": 6,
+    "hex": 8,
+}
+
 
 def _get_and_check_ids(
     name: str, container: dict, id_list: list, given_id: int | None
@@ -518,6 +530,114 @@ class CubitPy(object):
         self.cubit.reset()
         self._default_cubit_variables()
 
+    def cmd_batch(self, commands: list[str]) -> list:
+        """Run multiple cubit commands with a single call to the client.
+
+        The commands after the first one that fails are not run. Messages
+        and errors of the commands are reported after the batch.
+
+        Args:
+            commands: The cubit commands, they are run in the given order.
+
+        Returns:
+            A list with the return values of `cmd` for each command.
+        """
+        return self.cubit.cubit_connect.send_batch(
+            [(self.cubit, "cmd", [command]) for command in commands]
+        )
+
+    def pipeline(self):
+        """Context manager in which `cmd` calls do not wait for cubit to
+        finish.
+
+        Within this context, `cmd` returns None. Calls that return a
+        value, and leaving the context, wait for all previously sent
+        commands. Errors in the commands are raised at that point.
+
+        Returns:
+            The context manager of the connection to the cubit client.
+        """
+        return self.cubit.cubit_connect.pipeline()
+
+    def get_nodal_coordinates_bulk(self, node_ids: list[int]) -> np.ndarray:
+        """Get the coordinates of multiple nodes with a single call to the
+        client.
+
+        Args:
+            node_ids: The IDs of the nodes.
+
+        Returns:
+            An array with the shape (n_nodes, 3) containing the coordinates of
+            the nodes in the given order.
+        """
+        if len(node_ids) == 0:
+            return np.zeros((0, 3))
+        return np.array(
+            self.cubit.cubit_connect.send_batch(
+                [
+                    (self.cubit, "get_nodal_coordinates", [node_id])
+                    for node_id in node_ids
+                ]
+            )
+        )
+
+    def get_curve_tangents(self, curves: list, location: list[float]) -> np.ndarray:
+        """Get the tangents of multiple curves with a single call to the
+        client.
+
+        Args:
+            curves: The cubit curve objects.
+            location: The tangent of each curve is evaluated at the point on
+                the curve that is closest to this location.
+
+        Returns:
+            An array with the shape (n_curves, 3) containing the tangents of
+            the curves in the given order.
+        """
+        if len(curves) == 0:
+            return np.zeros((0, 3))
+        return np.array(
+            self.cubit.cubit_connect.send_batch(
+                [(curve, "tangent", [location]) for curve in curves]
+            )
+        )
+
+    def get_all_nodal_coordinates(self) -> np.ndarray:
+        """Get the coordinates of all nodes in the model.
+
+        Returns:
+            An array with the shape (n_nodes, 3) containing the coordinates of
+            the nodes, sorted by the node IDs.
+        """
+        return self.get_nodal_coordinates_bulk(self.get_entities("node"))
+
+    def get_all_connectivity(self, element_type: str) -> np.ndarray:
+        """Get the connectivity of all elements of a given type.
+
+        Args:
+            element_type: The cubit name of the element type, i.e., "edge",
+                "tri", "quad", "tet", "pyramid", "wedge" or "hex".
+
+        Returns:
+            An int32 array with the shape (n_elements, n_nodes_per_element)
+            containing the node IDs of the elements, sorted by the element IDs.
+            If there are no elements of this type, the array has zero rows.
+        """
+        element_ids = self.get_entities(element_type)
+        if len(element_ids) == 0:
+            return np.zeros(
+                (0, _CONNECTIVITY_NODE_COUNTS[element_type]), dtype=np.int32
+            )
+        return np.array(
+            self.cubit.cubit_connect.send_batch(
+                [
+                    (self.cubit, "get_connectivity", [element_type, element_id])
+                    for element_id in element_ids
+                ]
+            ),
+            dtype=np.int32,
+        )
+
     def cmd_return(self, cmd: str, geometry_type: GeometryType, **kwargs):
         """Run a cubit command and return the created geometry object.
 
@@ -680,8 +800,15 @@ class CubitPy(object):
             Time (in seconds) to wait after sending the write command until the
             new cubit session is opened.
         testing: bool
-            If this is true, cubit will not be opened, instead the created
-            journal and command will re returned.
+            If this is true, cubit will not be opened and the journal file is
+            not written, instead the created journal text and command are
+            returned. The cubit state is still exported.
+
+        Return
+        ----
+        If testing is true, a tuple with the text of the journal file and the
+        command to open cubit (a list of arguments for a local cubit session,
+        with quoted paths for a remote one). Otherwise None.
         """
 
         # Export the cubit state. After the export, we wait, to ensure that the
@@ -702,7 +829,8 @@ class CubitPy(object):
             temp_path = Path(cupy.temp_dir)
         state_path = temp_path / ("state" + "." + extension)
         self._export_cub(state_path)
-        time.sleep(delay)
+        if not testing:
+            time.sleep(delay)
 
         # Get path and content of the journal file that opens the state in cubit.
         journal_path = temp_path / "open_state.jou"
@@ -717,6 +845,10 @@ class CubitPy(object):
             cubit_command = self._get_display_in_cubit_command(
                 cupy.get_cubit_exe_path(), journal_path, add_quotes=True
             )
+
+            if testing:
+                return journal_text, cubit_command
+
             self.cubit.cubit_connect.send_and_return(
                 [
                     "display_in_cubit",
@@ -728,20 +860,20 @@ class CubitPy(object):
                 ]
             )
         else:
-            # Write file that opens the state in cubit.
-            with open(journal_path, "w") as journal:
-                journal.write(journal_text)
-
             # Get the command and arguments to open cubit with.
             cubit_command = self._get_display_in_cubit_command(
                 cupy.get_cubit_exe_path(), journal_path
             )
 
-            if not testing:
-                # Open the state in cubit.
-                subprocess.call(
-                    cubit_command,  # nosec B603
-                    cwd=cupy.temp_dir,
-                )
-            else:
-                return journal_path
+            if testing:
+                return journal_text, cubit_command
+
+            # Write file that opens the state in cubit.
+            with open(journal_path, "w") as journal:
+                journal.write(journal_text)
+
+            # Open the state in cubit.
+            subprocess.call(
+                cubit_command,  # nosec B603
+                cwd=cupy.temp_dir,
+            )
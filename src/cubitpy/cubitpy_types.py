@@ -35,34 +35,35 @@ class GeometryType(Enum):
 
     def get_cubit_string(self):
         """Return the string that represents this item in cubit."""
-
-        if self == self.vertex:
-            return "vertex"
-        elif self == self.curve:
-            return "curve"
-        elif self == self.surface:
-            return "surface"
-        elif self == self.volume:
-            return "volume"
-        else:
+        try:
+            return _GEOMETRY_TYPE_CUBIT_STRINGS[self]
+        except KeyError:
             raise ValueError("Got unexpected type {}!".format(self))
 
     def get_dat_bc_section_string(self):
         """Return the string that represents this item in a dat file
         section."""
-
-        if self == self.vertex:
-            return "POINT"
-        elif self == self.curve:
-            return "LINE"
-        elif self == self.surface:
-            return "SURF"
-        elif self == self.volume:
-            return "VOL"
-        else:
+        try:
+            return _GEOMETRY_TYPE_DAT_BC_SECTION_STRINGS[self]
+        except KeyError:
             raise ValueError("Got unexpected type {}!".format(self))
 
 
+_GEOMETRY_TYPE_CUBIT_STRINGS = {
+    GeometryType.vertex: "vertex",
+    GeometryType.curve: "curve",
+    GeometryType.surface: "surface",
+    GeometryType.volume: "volume",
+}
+
+_GEOMETRY_TYPE_DAT_BC_SECTION_STRINGS = {
+    GeometryType.vertex: "POINT",
+    GeometryType.curve: "LINE",
+    GeometryType.surface: "SURF",
+    GeometryType.volume: "VOL",
+}
+
+
 class FiniteElementObject(Enum):
     """Enum for finite element objects."""
 
@@ -76,21 +77,10 @@ class FiniteElementObject(Enum):
 
     def get_cubit_string(self):
         """Return the string that represents this item in cubit."""
-
-        if self == self.hex:
-            return "hex"
-        elif self == self.tet:
-            return "tet"
-        elif self == self.wedge:
-            return "wedge"
-        elif self == self.face:
-            return "face"
-        elif self == self.triangle:
-            return "tri"
-        elif self == self.edge:
-            return "edge"
-        elif self == self.node:
-            return "node"
+        try:
+            return _FINITE_ELEMENT_OBJECT_CUBIT_STRINGS[self]
+        except KeyError:
+            raise ValueError("Got unexpected type {}!".format(self))
 
     def get_dat_bc_section_string(self):
         """Return the string that represents this item in a dat file section.
@@ -98,12 +88,23 @@ class FiniteElementObject(Enum):
         Currently this only makes sense for the node type, when
         explicitly defining boundary conditions on nodes.
         """
-        if self == self.node:
+        if self is FiniteElementObject.node:
             return "POINT"
         else:
             raise ValueError("Got unexpected type {}!".format(self))
 
 
+_FINITE_ELEMENT_OBJECT_CUBIT_STRINGS = {
+    FiniteElementObject.hex: "hex",
+    FiniteElementObject.tet: "tet",
+    FiniteElementObject.wedge: "wedge",
+    FiniteElementObject.face: "face",
+    FiniteElementObject.triangle: "tri",
+    FiniteElementObject.edge: "edge",
+    FiniteElementObject.node: "node",
+}
+
+
 class CubitItems(Enum):
     """Enum for cubit internal items such as groups."""
 
@@ -128,152 +129,116 @@ class ElementType(Enum):
     quad4 = auto()
     wedge6 = auto()
 
+    def _get_data(self):
+        """Return the tuple with the data for this element type."""
+        try:
+            return _ELEMENT_TYPE_DATA[self]
+        except KeyError:
+            raise ValueError("Got wrong element type {}!".format(self))
+
     def get_cubit_names(self):
         """Get the strings that are needed to mesh and describe this element in
         cubit."""
-
-        # Get the element type parameters.
-        if (
-            self == self.hex8
-            or self == self.hex8sh
-            or self == self.hex8_fluid
-            or self == self.hex8_thermo
-            or self == self.hex8_scatra
-        ):
-            cubit_scheme = "Auto"
-            cubit_element_type = "HEX8"
-        elif self == self.hex20:
-            cubit_scheme = "Auto"
-            cubit_element_type = "HEX20"
-        elif self == self.hex27:
-            cubit_scheme = "Auto"
-            cubit_element_type = "HEX27"
-        elif (
-            self == self.tet4
-            or self == self.tet4_fluid
-            or self == self.tet4_thermo
-            or self == self.tet4_scatra
-        ):
-            cubit_scheme = "Tetmesh"
-            cubit_element_type = "TETRA4"
-        elif self == self.tet10:
-            cubit_scheme = "Tetmesh"
-            cubit_element_type = "TETRA10"
-        elif self == self.quad4:
-            cubit_scheme = "Auto"
-            cubit_element_type = "QUAD4"
-        elif self == self.wedge6:
-            cubit_scheme = None
-            cubit_element_type = "WEDGE6"
-        else:
-            raise ValueError("Got wrong element type {}!".format(self))
-
+        cubit_scheme, cubit_element_type, _, _, _, _ = self._get_data()
         return cubit_scheme, cubit_element_type
 
     def get_four_c_name(self):
         """Get the name of this element in 4C."""
-
-        # Get the element type parameters.
-        if (
-            self == self.hex8sh
-            or self == self.hex8
-            or self == self.hex20
-            or self == self.hex27
-            or self == self.tet10
-            or self == self.tet4
-            or self == self.wedge6
-            or self == self.quad4
-        ):
-            return "SOLID"
-        elif self == self.hex8_fluid or self == self.tet4_fluid:
-            return "FLUID"
-        elif self == self.hex8_thermo or self == self.tet4_thermo:
-            return "THERMO"
-        elif self == self.hex8_scatra or self == self.tet4_scatra:
-            return "TRANSP"
-        else:
-            raise ValueError("Got wrong element type {}!".format(self))
+        return self._get_data()[2]
 
     def get_four_c_section(self):
         """Get the correct section name of this element in 4C."""
-
-        if self == self.hex8_fluid or self == self.tet4_fluid:
-            return "FLUID"
-        elif (
-            self == self.hex20
-            or self == self.hex8
-            or self == self.hex20
-            or self == self.hex27
-            or self == self.tet4
-            or self == self.hex8sh
-            or self == self.tet10
-            or self == self.quad4
-            or self == self.wedge6
-        ):
-            return "STRUCTURE"
-        elif self == self.hex8_thermo or self == self.tet4_thermo:
-            return "THERMO"
-        elif self == self.hex8_scatra or self == self.tet4_scatra:
-            return "TRANSPORT"
-        else:
-            raise ValueError("Got wrong element type {}!".format(self))
+        return self._get_data()[3]
 
     def get_four_c_type(self):
         """Get the correct element shape name of this element in 4C."""
-
-        if (
-            self == self.hex8
-            or self == self.hex8sh
-            or self == self.hex8_fluid
-            or self == self.hex8_thermo
-            or self == self.hex8_scatra
-        ):
-            return "HEX8"
-        elif self == self.hex20:
-            return "HEX20"
-        elif self == self.hex27:
-            return "HEX27"
-        elif (
-            self == self.tet4
-            or self == self.tet4_fluid
-            or self == self.tet4_thermo
-            or self == self.tet4_scatra
-        ):
-            return "TET4"
-        elif self == self.tet10:
-            return "TET10"
-        elif self == self.quad4:
-            return "QUAD4"
-        elif self == self.wedge6:
-            return "WEDGE6"
-        else:
-            raise ValueError("Got wrong element type {}!".format(self))
+        return self._get_data()[4]
 
     def get_default_four_c_description(self):
         """Get the default text for the description in 4C after the material
         string."""
-
-        # Get the element type parameters.
-        if (
-            self == self.hex8
-            or self == self.hex20
-            or self == self.hex27
-            or self == self.tet4
-            or self == self.tet10
-            or self == self.wedge6
-        ):
-            return {"KINEM": "nonlinear"}
-        elif self == self.hex8sh:
-            return {"KINEM": "nonlinear", "TECH": "shell_eas_ans"}
-
-        elif self == self.hex8_fluid or self == self.tet4_fluid:
-            return {"NA": "ALE"}
-        elif self == self.hex8_thermo or self == self.tet4_thermo:
-            return {}
-        elif self == self.hex8_scatra or self == self.tet4_scatra:
-            return {}
-        else:
+        description = self._get_data()[5]
+        if description is None:
             raise ValueError("Got wrong element type {}!".format(self))
+        # Return a copy, so the caller can modify the description.
+        return dict(description)
+
+
+# Data for each element type: cubit scheme, cubit element type, 4C element
+# name, 4C section, 4C cell type and the default 4C description (None if
+# there is no default description).
+_ELEMENT_TYPE_DATA = {
+    ElementType.hex8: (
+        "Auto",
+        "HEX8",
+        "SOLID",
+        "STRUCTURE",
+        "HEX8",
+        {"KINEM": "nonlinear"},
+    ),
+    ElementType.hex20: (
+        "Auto",
+        "HEX20",
+        "SOLID",
+        "STRUCTURE",
+        "HEX20",
+        {"KINEM": "nonlinear"},
+    ),
+    ElementType.hex27: (
+        "Auto",
+        "HEX27",
+        "SOLID",
+        "STRUCTURE",
+        "HEX27",
+        {"KINEM": "nonlinear"},
+    ),
+    ElementType.tet4: (
+        "Tetmesh",
+        "TETRA4",
+        "SOLID",
+        "STRUCTURE",
+        "TET4",
+        {"KINEM": "nonlinear"},
+    ),
+    ElementType.tet10: (
+        "Tetmesh",
+        "TETRA10",
+        "SOLID",
+        "STRUCTURE",
+        "TET10",
+        {"KINEM": "nonlinear"},
+    ),
+    ElementType.hex8sh: (
+        "Auto",
+        "HEX8",
+        "SOLID",
+        "STRUCTURE",
+        "HEX8",
+        {"KINEM": "nonlinear", "TECH": "shell_eas_ans"},
+    ),
+    ElementType.hex8_fluid: ("Auto", "HEX8", "FLUID", "FLUID", "HEX8", {"NA": "ALE"}),
+    ElementType.tet4_fluid: (
+        "Tetmesh",
+        "TETRA4",
+        "FLUID",
+        "FLUID",
+        "TET4",
+        {"NA": "ALE"},
+    ),
+    ElementType.hex8_thermo: ("Auto", "HEX8", "THERMO", "THERMO", "HEX8", {}),
+    ElementType.tet4_thermo: ("Tetmesh", "TETRA4", "THERMO", "THERMO", "TET4", {}),
+    ElementType.hex8_scatra: ("Auto", "HEX8", "TRANSP", "TRANSPORT", "HEX8", {}),
+    ElementType.tet4_scatra: ("Tetmesh", "TETRA4", "TRANSP", "TRANSPORT", "TET4", {}),
+    ElementType.quad4: ("Auto", "QUAD4", "SOLID", "STRUCTURE", "QUAD4", None),
+    ElementType.wedge6: (
+        None,
+        "WEDGE6",
+        "SOLID",
+        "STRUCTURE",
+        "WEDGE6",
+        {"KINEM": "nonlinear"},
+    ),
+}
 
 
 class BoundaryConditionType(Enum):
@@ -298,62 +263,79 @@ class BoundaryConditionType(Enum):
     def get_dat_bc_section_header(self, geometry_type):
         """Get the header string for the boundary condition input section in
         the dat file."""
-
-        if self == self.dirichlet or self == self.neumann:
-            if self == self.dirichlet:
-                self_string = "DIRICH"
-            else:
-                self_string = "NEUMANN"
-
-            return "DESIGN {} {} CONDITIONS".format(
-                geometry_type.get_dat_bc_section_string(), self_string
-            )
-        elif (
-            self == self.beam_to_solid_volume_meshtying
-            and geometry_type == GeometryType.volume
-        ):
-            return "BEAM INTERACTION/BEAM TO SOLID VOLUME MESHTYING VOLUME"
-        elif (
-            self == self.beam_to_solid_surface_meshtying
-            and geometry_type == GeometryType.surface
-        ):
-            return "BEAM INTERACTION/BEAM TO SOLID SURFACE MESHTYING SURFACE"
-        elif (
-            self == self.beam_to_solid_surface_contact
-            and geometry_type == GeometryType.surface
-        ):
-            return "BEAM INTERACTION/BEAM TO SOLID SURFACE CONTACT SURFACE"
-        elif self == self.point_coupling and (geometry_type == GeometryType.vertex):
-            return "DESIGN POINT COUPLING CONDITIONS"
-        elif self == self.solid_to_solid_contact and (
-            geometry_type == GeometryType.surface
-        ):
-            return "DESIGN SURF MORTAR CONTACT CONDITIONS 3D"
-        elif self == self.solid_to_solid_contact and (
-            geometry_type == GeometryType.curve
-        ):
-            return "DESIGN LINE MORTAR CONTACT CONDITIONS 2D"
-        elif self == self.fsi_coupling and (geometry_type == GeometryType.surface):
-            return "DESIGN FSI COUPLING SURF CONDITIONS"
-        elif self == self.ale_dirichlet and (geometry_type == GeometryType.surface):
-            return "DESIGN SURF ALE DIRICH CONDITIONS"
-        elif self == self.flow_rate and (geometry_type == GeometryType.surface):
-            return "DESIGN FLOW RATE SURF CONDITIONS"
-        elif self == self.fluid_neumann_inflow_stab and (
-            geometry_type == GeometryType.surface
-        ):
-            return "FLUID NEUMANN INFLOW SURF CONDITIONS"
-        elif self == self.fluid_neumann_inflow_stab and (
-            geometry_type == GeometryType.curve
-        ):
-            return "FLUID NEUMANN INFLOW LINE CONDITIONS"
-        elif self == self.periodic_rve_surface and (
-            geometry_type == GeometryType.surface
-        ):
-            return "DESIGN SURF PERIODIC RVE 3D BOUNDARY CONDITIONS"
-        elif self == self.periodic_rve_edge and (geometry_type == GeometryType.curve):
-            return "DESIGN EDGE PERIODIC RVE 2D BOUNDARY CONDITIONS"
-        else:
+        try:
+            return _BC_SECTION_HEADERS[(self, geometry_type)]
+        except KeyError:
             raise ValueError(
                 "No implemented case for {} and {}!".format(self, geometry_type)
             )
+
+
+# Header strings for the boundary condition input sections, the keys are the
+# boundary condition type and the geometry type.
+_BC_SECTION_HEADERS = {
+    (
+        BoundaryConditionType.beam_to_solid_volume_meshtying,
+        GeometryType.volume,
+    ): "BEAM INTERACTION/BEAM TO SOLID VOLUME MESHTYING VOLUME",
+    (
+        BoundaryConditionType.beam_to_solid_surface_meshtying,
+        GeometryType.surface,
+    ): "BEAM INTERACTION/BEAM TO SOLID SURFACE MESHTYING SURFACE",
+    (
+        BoundaryConditionType.beam_to_solid_surface_contact,
+        GeometryType.surface,
+    ): "BEAM INTERACTION/BEAM TO SOLID SURFACE CONTACT SURFACE",
+    (
+        BoundaryConditionType.point_coupling,
+        GeometryType.vertex,
+    ): "DESIGN POINT COUPLING CONDITIONS",
+    (
+        BoundaryConditionType.solid_to_solid_contact,
+        GeometryType.surface,
+    ): "DESIGN SURF MORTAR CONTACT CONDITIONS 3D",
+    (
+        BoundaryConditionType.solid_to_solid_contact,
+        GeometryType.curve,
+    ): "DESIGN LINE MORTAR CONTACT CONDITIONS 2D",
+    (
+        BoundaryConditionType.fsi_coupling,
+        GeometryType.surface,
+    ): "DESIGN FSI COUPLING SURF CONDITIONS",
+    (
+        BoundaryConditionType.ale_dirichlet,
+        GeometryType.surface,
+    ): "DESIGN SURF ALE DIRICH CONDITIONS",
+    (
+        BoundaryConditionType.flow_rate,
+        GeometryType.surface,
+    ): "DESIGN FLOW RATE SURF CONDITIONS",
+    (
+        BoundaryConditionType.fluid_neumann_inflow_stab,
+        GeometryType.surface,
+    ): "FLUID NEUMANN INFLOW SURF CONDITIONS",
+    (
+        BoundaryConditionType.fluid_neumann_inflow_stab,
+        GeometryType.curve,
+    ): "FLUID NEUMANN INFLOW LINE CONDITIONS",
+    (
+        BoundaryConditionType.periodic_rve_surface,
+        GeometryType.surface,
+    ): "DESIGN SURF PERIODIC RVE 3D BOUNDARY CONDITIONS",
+    (
+        BoundaryConditionType.periodic_rve_edge,
+        GeometryType.curve,
+    ): "DESIGN EDGE PERIODIC RVE 2D BOUNDARY CONDITIONS",
+}
+_BC_SECTION_HEADERS.update(
+    {
+        (bc_type, geometry_type): "DESIGN {} {} CONDITIONS".format(
+            geometry_type.get_dat_bc_section_string(), bc_string
+        )
+        for bc_type, bc_string in (
+            (BoundaryConditionType.dirichlet, "DIRICH"),
+            (BoundaryConditionType.neumann, "NEUMANN"),
+        )
+        for geometry_type in list(GeometryType) + [FiniteElementObject.node]
+    }
+)
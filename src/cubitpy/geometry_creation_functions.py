@@ -21,6 +21,8 @@
 # THE SOFTWARE.
 """Implements functions that create geometries in cubit."""
 
+import numpy as np
+
 from cubitpy.conf import cupy
 from cubitpy.cubit_utility import formatter as formatter
 
@@ -98,6 +100,7 @@ def create_parametric_surface(
     delete_points=True,
     function_args=[],
     function_kwargs={},
+    vectorized=False,
 ):
     """Create a parametric surface in space.
 
@@ -120,42 +123,77 @@ def create_parametric_surface(
         Additional arguments for the function.
     function_kwargs: dir
         Additional keyword arguments for the function.
+    vectorized: bool
+        If this is true, the function is called once with arrays containing
+        the parameter coordinates of all grid points, and has to return the
+        three coordinate arrays of the points, e.g., [x, y, z]. This is
+        possible for functions that are composed of numpy operations.
     """
 
-    # Loop over the parameter coordinates dimension.
     curves = [[], []]
-    for dim in range(2):
-        # Get the constant values for the other parameter coordinate in this
-        # direction.
-        other_dim = 1 - dim
+    if vectorized:
+        # Evaluate the function on the whole parameter grid.
         parameter_points = [
-            interval[other_dim][0]
-            + i
-            * (interval[other_dim][1] - interval[other_dim][0])
-            / float(n_segments[other_dim])
-            for i in range(n_segments[other_dim] + 1)
+            interval[dim][0]
+            + np.arange(n_segments[dim] + 1)
+            * (interval[dim][1] - interval[dim][0])
+            / float(n_segments[dim])
+            for dim in range(2)
         ]
+        u, v = np.meshgrid(*parameter_points, indexing="ij")
+        points = np.moveaxis(
+            np.asarray(f(u, v, *function_args, **function_kwargs), dtype=float),
+            0,
+            -1,
+        )
 
-        # Create all curves along this parameter coordinate.
-        for point in parameter_points:
-
-            def f_temp(t):
-                """Temporary function that is evaluated at a constant value of
-                one of the two parameter coordinates."""
-                if dim == 0:
-                    return f(t, point, *function_args, **function_kwargs)
-                else:
-                    return f(point, t, *function_args, **function_kwargs)
-
-            curves[dim].append(
-                create_parametric_curve(
-                    cubit,
-                    f_temp,
-                    interval[dim],
-                    n_segments=n_segments[dim],
-                    delete_points=delete_points,
+        # Create the curves along the grid lines.
+        for j in range(n_segments[1] + 1):
+            curves[0].append(
+                create_spline_interpolation_curve(
+                    cubit, points[:, j], delete_points=delete_points
+                )
+            )
+        for i in range(n_segments[0] + 1):
+            curves[1].append(
+                create_spline_interpolation_curve(
+                    cubit, points[i, :], delete_points=delete_points
                 )
             )
+    else:
+        # Loop over the parameter coordinates dimension.
+        for dim in range(2):
+            # Get the constant values for the other parameter coordinate in this
+            # direction.
+            other_dim = 1 - dim
+            parameter_points = [
+                interval[other_dim][0]
+                + i
+                * (interval[other_dim][1] - interval[other_dim][0])
+                / float(n_segments[other_dim])
+                for i in range(n_segments[other_dim] + 1)
+            ]
+
+            # Create all curves along this parameter coordinate.
+            for point in parameter_points:
+
+                def f_temp(t):
+                    """Temporary function that is evaluated at a constant value of
+                    one of the two parameter coordinates."""
+                    if dim == 0:
+                        return f(t, point, *function_args, **function_kwargs)
+                    else:
+                        return f(point, t, *function_args, **function_kwargs)
+
+                curves[dim].append(
+                    create_parametric_curve(
+                        cubit,
+                        f_temp,
+                        interval[dim],
+                        n_segments=n_segments[dim],
+                        delete_points=delete_points,
+                    )
+                )
 
     # Create the surface.
     cubit.cmd(
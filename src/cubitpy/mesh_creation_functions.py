@@ -80,23 +80,26 @@ def create_brick(
     # Set the element type.
     cubit.add_element_type(volume, el_type=element_type, **kwargs)
 
-    # Set mesh properties.
+    # Set mesh properties. All commands are collected and run with a single
+    # call to cubit.
+    commands = []
     if mesh_interval is not None:
+        # Get the tangents of all lines with a single call.
+        curves = solid.curves()
+        tangents = cubit.get_curve_tangents(curves, [0, 0, 0])
+
         # Get the lines in x, y and z direction.
         dir_curves = [[] for _i in range(3)]
-        for curve in solid.curves():
-            # Get the tangent on the line.
-            tan = curve.tangent([0, 0, 0])
+        for curve, tan in zip(curves, tangents):
             for direction in range(3):
                 # Project the tangent on the basis vector and check if it is
                 # larger than 0.
                 if np.abs(tan[direction]) > cupy.eps_pos:
                     dir_curves[direction].append(curve)
-                    continue
 
         # Set the number of elements in x, y and z direction.
         for direction in range(3):
-            cubit.cmd(
+            commands.append(
                 "{} interval {} scheme equal".format(
                     formatter(dir_curves[direction]), mesh_interval[direction]
                 )
@@ -104,11 +107,14 @@ def create_brick(
 
     if mesh_factor is not None:
         # Set a cubit factor for the mesh size.
-        cubit.cmd("{} size auto factor {}".format(formatter(volume), mesh_factor))
+        commands.append("{} size auto factor {}".format(formatter(volume), mesh_factor))
 
     # Mesh the created block.
     if mesh:
-        cubit.cmd("mesh {}".format(formatter(volume)))
+        commands.append("mesh {}".format(formatter(volume)))
+
+    if len(commands) > 0:
+        cubit.cmd_batch(commands)
 
     return solid
 
@@ -0,0 +1,47 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2026 CubitPy Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Shared fixtures for the CubitPy tests."""
+
+import pytest
+
+from cubitpy.cubitpy import CubitPy
+
+
+def reset_cubit(cubit):
+    """Reset a CubitPy object to the state of a newly created one."""
+    cubit.reset()
+    cubit.cmd("set geometry engine acis")
+
+
+@pytest.fixture(scope="session")
+def cubit_session():
+    """Create a single CubitPy object that is shared between all tests of a
+    session, since initializing cubit is expensive."""
+    return CubitPy()
+
+
+@pytest.fixture
+def cubit(cubit_session):
+    """Return the shared CubitPy object, reset to the state of a newly created
+    one."""
+    reset_cubit(cubit_session)
+    return cubit_session
@@ -22,13 +22,19 @@
 """This script is used to test the functionality of the cubitpy module."""
 
 import copy
+import difflib
+import filecmp
+import json
 import os
 import shutil
 import subprocess
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 import pytest
+from conftest import reset_cubit
 from deepdiff import DeepDiff
 from fourcipp.fourc_input import FourCInput
 from fourcipp.utils.dict_utils import compare_nested_dicts_or_lists
@@ -36,11 +42,14 @@ from fourcipp.utils.dict_utils import compare_nested_dicts_or_lists
 from cubitpy.conf import CubitPyWarning, cupy
 from cubitpy.cubit_utility import (
     formatter,
+    get_sorted_node_ids,
     get_surface_center,
+    get_surface_centers_and_normals,
     import_fluent_geometry,
     node_set_info_to_string,
     string_to_node_set_info,
 )
+from cubitpy.cubit_wrapper import cubit_wrapper_host
 from cubitpy.cubitpy import CubitPy
 from cubitpy.geometry_creation_functions import (
     create_brick_by_corner_points,
@@ -52,8 +61,19 @@ from cubitpy.mesh_creation_functions import create_brick, extrude_mesh_normal_to
 # Define the testing paths.
 testing_path = os.path.abspath(os.path.dirname(__file__))
 testing_input = os.path.join(testing_path, "input-files-ref")
-testing_temp = os.path.join(testing_path, "testing-tmp")
+# Each pytest-xdist worker uses its own temporary directory. The parent
+# directory can be set with CUBITPY_TEST_TMP, e.g., to a RAM disk like
+# /dev/shm.
+testing_temp = os.path.join(
+    os.environ.get("CUBITPY_TEST_TMP", testing_path),
+    "testing-tmp-{}".format(os.environ.get("PYTEST_XDIST_WORKER", "0")),
+)
 testing_external_geometry = os.path.join(testing_path, "external-geometry")
+os.makedirs(testing_temp, exist_ok=True)
+
+# Path templates for the reference and output input files of a test.
+REF_FILE_TEMPLATE = os.path.join(testing_input, "{}.4C.yaml")
+OUT_FILE_TEMPLATE = os.path.join(testing_temp, "{}.4C.yaml")
 
 
 # Global variable if this test is run by GitLab.
@@ -66,15 +86,48 @@ CUBIT_VERSION_TESTING_IDENTIFIER = {True: "coreform", False: "cubit15"}[
     cupy.is_coreform()
 ]
 
+# Squared tolerance to check if two points are at the same position.
+EPS_POS_SQUARED = cupy.eps_pos**2
+
+# Boundary condition descriptions shared by multiple tests. They are not
+# modified when creating node sets.
+BC_DESCRIPTION_ZERO_3 = {
+    "NUMDOF": 3,
+    "ONOFF": [1, 1, 1],
+    "VAL": [0, 0, 0],
+    "FUNCT": [0, 0, 0],
+}
+BC_DESCRIPTION_ZERO_6_POSITIONS = {
+    "NUMDOF": 6,
+    "ONOFF": [1, 1, 1, 0, 0, 0],
+    "VAL": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    "FUNCT": [0, 0, 0, 0, 0, 0],
+}
+
+# Element types used in the element type tests.
+TET_ELEMENT_TYPES = (cupy.element_type.tet4, cupy.element_type.tet10)
+HEX_ELEMENT_TYPES = (
+    cupy.element_type.hex8,
+    cupy.element_type.hex20,
+    cupy.element_type.hex27,
+    cupy.element_type.hex8sh,
+)
+
 PYTEST_PARAMETERIZE_EXO = [
     "export_exo,name",
     ((False, "without_exo"), (True, "with_exo")),
 ]
 
 
-def check_tmp_dir():
-    """Check if the temp directory exists, if not create it."""
-    os.makedirs(testing_temp, exist_ok=True)
+@lru_cache(maxsize=64)
+def load_reference_input(ref_file, mtime):
+    """Load a reference input file.
+
+    The loaded files are cached, the modification time is part of the
+    key, so changed reference files are loaded again. The returned
+    object is shared between calls and must not be modified.
+    """
+    return FourCInput.from_4C_yaml(ref_file)
 
 
 def compare_yaml(
@@ -120,11 +173,9 @@ def compare_yaml(
     if additional_identifier is not None:
         compare_name += "_" + additional_identifier
 
-    check_tmp_dir()
-
     # File paths
-    ref_file = Path(testing_input) / (compare_name + ".4C.yaml")
-    out_file = Path(testing_temp) / (compare_name + ".4C.yaml")
+    ref_file = Path(REF_FILE_TEMPLATE.format(compare_name))
+    out_file = Path(OUT_FILE_TEMPLATE.format(compare_name))
 
     if mesh_in_exo:
         # dump the input script with the mesh in exodus format
@@ -135,7 +186,11 @@ def compare_yaml(
     else:
         cubit.dump(out_file)
 
-    ref_input_file = FourCInput.from_4C_yaml(ref_file)
+    # Identical files do not have to be parsed and compared.
+    if filecmp.cmp(ref_file, out_file, shallow=False):
+        return
+
+    ref_input_file = load_reference_input(ref_file, ref_file.stat().st_mtime)
     out_input_file = FourCInput.from_4C_yaml(out_file)
 
     try:
@@ -165,8 +220,17 @@ def compare_yaml(
             if diff:
                 print(diff.pretty())
 
-        if TESTING_GITHUB:
-            subprocess.run(["diff", ref_file, out_file])
+        if TESTING_GITHUB or "PYTEST_XDIST_WORKER" in os.environ:
+            # Do not open a viewer if the tests are not run interactively,
+            # i.e., on GitHub or in parallel with pytest-xdist.
+            sys.stdout.writelines(
+                difflib.unified_diff(
+                    ref_file.read_text().splitlines(keepends=True),
+                    out_file.read_text().splitlines(keepends=True),
+                    fromfile=str(ref_file),
+                    tofile=str(out_file),
+                )
+            )
         elif shutil.which("meld"):
             subprocess.Popen(["meld", ref_file, out_file])
         elif shutil.which("code"):
@@ -211,18 +275,17 @@ def create_block(cubit, np_arrays=False):
         move_array = np.array(move_array)
     cubit.move(block, move_array)
 
-    # Set the meshing parameters for the curves.
-    for line in block.curves():
-        point_on_line = line.position_from_fraction(0.5)
-        tangent = np.array(line.tangent(point_on_line))
-        if np.abs(np.dot(tangent, [1, 0, 0])) > 1e-5:
-            cubit.set_line_interval(line, nx)
-        elif np.abs(np.dot(tangent, [0, 1, 0])) > 1e-5:
-            cubit.set_line_interval(line, ny)
-        elif np.abs(np.dot(tangent, [0, 0, 1])) > 1e-5:
-            cubit.set_line_interval(line, nz)
-        else:
-            raise ArithmeticError("Error")
+    # Set the meshing parameters for the curves, depending on the direction of
+    # their tangents.
+    lines = block.curves()
+    tangents = np.abs(
+        [line.tangent(line.position_from_fraction(0.5)) for line in lines]
+    )
+    if np.any(np.max(tangents, axis=1) <= 1e-5):
+        raise ArithmeticError("Error")
+    n_intervals = (nx, ny, nz)
+    for line, direction in zip(lines, np.argmax(tangents > 1e-5, axis=1)):
+        cubit.set_line_interval(line, n_intervals[direction])
 
     # Mesh the block and use a user defined element description
     block.mesh()
@@ -234,63 +297,46 @@ def create_block(cubit, np_arrays=False):
         bc_description={"KINEM": "linear"},
     )
 
-    # Create node sets.
-    for i, surf in enumerate(block.surfaces()):
-        normal = np.array(surf.normal_at(get_surface_center(surf)))
-        if np.dot(normal, [0, 0, -1]) == 1:
+    # Create node sets, depending on the z-component of the surface normals.
+    surfaces = block.surfaces()
+    _, normals = get_surface_centers_and_normals(surfaces)
+    normals_z = normals[:, 2]
+    for i, (surf, normal_z) in enumerate(zip(surfaces, normals_z)):
+        if normal_z == -1:
             cubit.add_node_set(
                 surf,
                 name="fix",
                 bc_section="DESIGN SURF DIRICH CONDITIONS",
-                bc_description={
-                    "NUMDOF": 6,
-                    "ONOFF": [1, 1, 1, 0, 0, 0],
-                    "VAL": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-                    "FUNCT": [0, 0, 0, 0, 0, 0],
-                },
+                bc_description=BC_DESCRIPTION_ZERO_6_POSITIONS,
             )
-        elif np.dot(normal, [0, 0, 1]) == 1:
+        elif normal_z == 1:
             cubit.add_node_set(
                 surf,
                 name="load",
                 bc_section="DESIGN SURF DIRICH CONDITIONS",
-                bc_description={
-                    "NUMDOF": 6,
-                    "ONOFF": [1, 1, 1, 0, 0, 0],
-                    "VAL": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-                    "FUNCT": [0, 0, 0, 0, 0, 0],
-                },
+                bc_description=BC_DESCRIPTION_ZERO_6_POSITIONS,
             )
         else:
             cubit.add_node_set(
                 surf,
                 name="load{}".format(i),
                 bc_section="DESIGN SURF NEUMANN CONDITIONS",
-                bc_description={
-                    "NUMDOF": 6,
-                    "ONOFF": [1, 1, 1, 0, 0, 0],
-                    "VAL": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-                    "FUNCT": [0, 0, 0, 0, 0, 0],
-                },
+                bc_description=BC_DESCRIPTION_ZERO_6_POSITIONS,
             )
 
     # Compare the input file created for 4C.
     compare_yaml(cubit, base_name="test_create_block")
 
 
-def test_create_block():
+def test_create_block(cubit):
     """Test the creation of a cubit block."""
 
-    # Initialize cubit.
-    cubit = CubitPy()
     create_block(cubit)
 
 
-def test_create_block_numpy_arrays():
+def test_create_block_numpy_arrays(cubit):
     """Test the creation of a cubit block."""
 
-    # Initialize cubit.
-    cubit = CubitPy()
     create_block(cubit, np_arrays=True)
 
 
@@ -315,7 +361,7 @@ def test_create_block_multiple():
     create_block(cubit_2)
 
 
-def test_create_block_unaltered_element_dict():
+def test_create_block_unaltered_element_dict(cubit):
     """Test that the creation of an input file does not alter given
     dictionaries."""
 
@@ -331,7 +377,6 @@ def test_create_block_unaltered_element_dict():
     bc_description_copy = copy.deepcopy(bc_description)
 
     # Create the model
-    cubit = CubitPy()
     brick = create_brick(
         cubit, 1, 2, 3, mesh_interval=[1, 2, 3], bc_description=element_description_copy
     )
@@ -353,10 +398,8 @@ def test_create_block_unaltered_element_dict():
     compare_nested_dicts_or_lists(bc_description, bc_description_copy)
 
 
-def test_create_wedge6():
+def test_create_wedge6(cubit):
     """Create a mesh with wedge elements."""
-    # Initialize cubit.
-    cubit = CubitPy()
 
     # Create nodes to define two tri elements
     for x in [-0.5, 0.5]:
@@ -391,18 +434,10 @@ def test_create_wedge6():
     compare_yaml(cubit)
 
 
-def test_element_types_tet():
+def test_element_types_tet(cubit):
     """Create a curved solid with different tet element types."""
 
-    # Initialize cubit.
-    cubit = CubitPy()
-
-    element_type_list = [
-        cupy.element_type.tet4,
-        cupy.element_type.tet10,
-    ]
-
-    for i, element_type in enumerate(element_type_list):
+    for i, element_type in enumerate(TET_ELEMENT_TYPES):
         cubit.cmd("create pyramid height 1 sides 3 radius 1.2 top 0")
         volume = cubit.volume(1 + i)
         cubit.cmd("move {} x {}".format(formatter(volume), i))
@@ -420,12 +455,7 @@ def test_element_types_tet():
             volume.surfaces()[1],
             name="fix_" + str(i),
             bc_section="DESIGN SURF DIRICH CONDITIONS",
-            bc_description={
-                "NUMDOF": 3,
-                "ONOFF": [1, 1, 1],
-                "VAL": [0, 0, 0],
-                "FUNCT": [0, 0, 0],
-            },
+            bc_description=BC_DESCRIPTION_ZERO_3,
         )
 
     cubit.fourc_input["FUNCT1"] = [{"SYMBOLIC_FUNCTION_OF_TIME": "t"}]
@@ -451,12 +481,9 @@ def test_element_types_tet():
 
 
 @pytest.mark.parametrize(*PYTEST_PARAMETERIZE_EXO)
-def test_element_types_tet_single_element(export_exo, name):
+def test_element_types_tet_single_element(cubit, export_exo, name):
     """Create a single tet element."""
 
-    # Initialize cubit.
-    cubit = CubitPy()
-
     cubit.cmd("create node location 0 0 0")
     cubit.cmd("create node location 1 0 0")
     cubit.cmd("create node location 0 1 0")
@@ -475,64 +502,46 @@ def test_element_types_tet_single_element(export_exo, name):
     compare_yaml(cubit, additional_identifier=name, mesh_in_exo=export_exo)
 
 
-def test_element_types_hex():
+def test_element_types_hex(cubit):
     """Create a curved solid with different hex element types."""
 
-    # Initialize cubit.
-    cubit = CubitPy()
-
-    element_type_list = [
-        cupy.element_type.hex8,
-        cupy.element_type.hex20,
-        cupy.element_type.hex27,
-        cupy.element_type.hex8sh,
-    ]
-
-    def add_arc(radius, angle):
-        """Add a arc segment."""
-        cubit.cmd(
-            "create curve arc radius {} center location 0 0 0 normal 0 0 1 start angle 0 stop angle {}".format(
-                radius, angle
-            )
+    def arc_command(radius, angle):
+        """Return the command to add a arc segment."""
+        return "create curve arc radius {} center location 0 0 0 normal 0 0 1 start angle 0 stop angle {}".format(
+            radius, angle
         )
 
-    for i, element_type in enumerate(element_type_list):
+    for i, element_type in enumerate(HEX_ELEMENT_TYPES):
         # Offset for the next volume.
         offset_point = i * 12
         offset_curve = i * 12
         offset_surface = i * 6
         offset_volume = i
 
-        # Add two arcs.
-        add_arc(1.1, 30)
-        add_arc(0.9, 30)
-
-        # Add the closing lines.
-        cubit.cmd(
-            "create curve vertex {} {}".format(2 + offset_point, 4 + offset_point)
-        )
-        cubit.cmd(
-            "create curve vertex {} {}".format(1 + offset_point, 3 + offset_point)
-        )
-
-        # Create the surface.
-        cubit.cmd(
-            "create surface curve {} {} {} {}".format(
-                1 + offset_curve,
-                2 + offset_curve,
-                3 + offset_curve,
-                4 + offset_curve,
-            )
+        cubit.cmd_batch(
+            [
+                # Add two arcs.
+                arc_command(1.1, 30),
+                arc_command(0.9, 30),
+                # Add the closing lines.
+                "create curve vertex {} {}".format(2 + offset_point, 4 + offset_point),
+                "create curve vertex {} {}".format(1 + offset_point, 3 + offset_point),
+                # Create the surface.
+                "create surface curve {} {} {} {}".format(
+                    1 + offset_curve,
+                    2 + offset_curve,
+                    3 + offset_curve,
+                    4 + offset_curve,
+                ),
+                # Create the volume.
+                "sweep surface {} perpendicular distance 0.2".format(
+                    1 + offset_surface
+                ),
+                # Move the volume.
+                "move volume {} x 0 y 0 z {}".format(1 + offset_volume, i * 0.4),
+            ]
         )
 
-        # Create the volume.
-        cubit.cmd(
-            "sweep surface {} perpendicular distance 0.2".format(1 + offset_surface)
-        )
-
-        # Move the volume.
-        cubit.cmd("move volume {} x 0 y 0 z {}".format(1 + offset_volume, i * 0.4))
-
         # Set the element type.
         cubit.add_element_type(
             cubit.volume(1 + offset_volume),
@@ -543,20 +552,19 @@ def test_element_types_hex():
         )
 
         # Set mesh properties.
-        cubit.cmd("volume {} size 0.2".format(1 + offset_volume))
-        cubit.cmd("mesh volume {}".format(1 + offset_volume))
+        cubit.cmd_batch(
+            [
+                "volume {} size 0.2".format(1 + offset_volume),
+                "mesh volume {}".format(1 + offset_volume),
+            ]
+        )
 
         # Add the node sets.
         cubit.add_node_set(
             cubit.surface(5 + offset_surface),
             name="fix_" + str(i),
             bc_section="DESIGN SURF DIRICH CONDITIONS",
-            bc_description={
-                "NUMDOF": 3,
-                "ONOFF": [1, 1, 1],
-                "VAL": [0, 0, 0],
-                "FUNCT": [0, 0, 0],
-            },
+            bc_description=BC_DESCRIPTION_ZERO_3,
         )
 
     cubit.fourc_input["FUNCT1"] = [{"SYMBOLIC_FUNCTION_OF_TIME": "t"}]
@@ -581,7 +589,7 @@ def test_element_types_hex():
 
 
 @pytest.mark.parametrize("plane", ["zplane", "yplane"])
-def test_element_types_quad(plane):
+def test_element_types_quad(cubit, plane):
     """Create a quad mesh on the given plane.
 
     We check two planes there because for 2D output depending on the
@@ -589,7 +597,6 @@ def test_element_types_quad(plane):
     entry if the automatic option from cubit while exporting the exo
     file is chosen.
     """
-    cubit = CubitPy()
     cubit.cmd(f"create surface rectangle width 1 height 2 {plane}")
     cubit.cmd("curve 1 3 interval 3")
     cubit.cmd("curve 2 4 interval 2")
@@ -608,22 +615,12 @@ def test_element_types_quad(plane):
     compare_yaml(cubit, additional_identifier=plane)
 
 
-def test_block_function():
+def test_block_function(cubit):
     """Create a solid block with different element types."""
 
-    # Initialize cubit.
-    cubit = CubitPy()
-
-    element_type_list = [
-        cupy.element_type.hex8,
-        cupy.element_type.hex20,
-        cupy.element_type.hex27,
-        cupy.element_type.hex8sh,
-    ]
-
     count = 0
     for interval in [True, False]:
-        for element_type in element_type_list:
+        for element_type in HEX_ELEMENT_TYPES:
             if interval:
                 kwargs_brick = {"mesh_interval": [3, 2, 1]}
             else:
@@ -643,23 +640,24 @@ def test_block_function():
             count += 1
 
     # Compare the input file created for 4C.
-    out_file = Path(testing_temp) / ("test_block_function.4C.yaml")
+    out_file = Path(OUT_FILE_TEMPLATE.format("test_block_function"))
     cubit.dump(out_file)
     compare_yaml(cubit)
 
 
-def test_extrude_mesh_function():
+def test_extrude_mesh_function(cubit):
     """Test the extrude mesh function."""
 
-    # Initialize cubit.
-    cubit = CubitPy()
-
     # Create dummy geometry to check, that the extrude functions work with
     # already existing geometry.
-    cubit.cmd("create surface circle radius 1 zplane")
-    cubit.cmd("mesh surface 1")
-    cubit.cmd("create brick x 1")
-    cubit.cmd("mesh volume 2")
+    cubit.cmd_batch(
+        [
+            "create surface circle radius 1 zplane",
+            "mesh surface 1",
+            "create brick x 1",
+            "mesh volume 2",
+        ]
+    )
 
     # Create and cut torus.
     cubit.cmd("create torus major radius 1.0 minor radius 0.5")
@@ -698,12 +696,9 @@ def test_extrude_mesh_function():
     compare_yaml(cubit)
 
 
-def test_extrude_mesh_function_average_normals_block():
+def test_extrude_mesh_function_average_normals_block(cubit):
     """Test the average extrude mesh function for two blocks."""
 
-    # Initialize cubit.
-    cubit = CubitPy()
-
     # Create L-shaped geometry.
     cubit.cmd("create brick x 1")
     cubit.cmd("create brick x 2 y 1 z 1")
@@ -741,13 +736,10 @@ def test_extrude_mesh_function_average_normals_block():
     compare_yaml(cubit)
 
 
-def test_extrude_mesh_function_average_normals_for_cylinder_and_sphere():
+def test_extrude_mesh_function_average_normals_for_cylinder_and_sphere(cubit):
     """Test the average extrude mesh function for curved surfaces (Toy Aneurysm
     Case)."""
 
-    # Initialize cubit.
-    cubit = CubitPy()
-
     # Offset between center of cylinder and sphere.
     offset = 0.8
 
@@ -801,11 +793,10 @@ def test_extrude_mesh_function_average_normals_for_cylinder_and_sphere():
     compare_yaml(cubit, rtol=1e-8, atol=1e-8)
 
 
-def test_node_set_geometry_type():
+def test_node_set_geometry_type(cubit):
     """Create the boundary conditions via the bc_type enum."""
 
     # First create the solid mesh.
-    cubit = CubitPy()
     solid = create_brick(cubit, 1, 1, 1, mesh_interval=[1, 1, 1])
 
     # Add all possible boundary conditions.
@@ -872,7 +863,7 @@ def test_node_set_geometry_type():
     cubit.add_node_set(
         cubit.group(
             add_value="add node {}".format(
-                " ".join([str(i + 1) for i in range(cubit.get_node_count())])
+                " ".join(map(str, range(1, cubit.get_node_count() + 1)))
             )
         ),
         name="point3",
@@ -915,9 +906,8 @@ def test_node_set_geometry_type():
     compare_yaml(cubit)
 
 
-def test_contact_condition_beam_to_surface():
+def test_contact_condition_beam_to_surface(cubit):
     """Test the beam-to-surface contact condition BC."""
-    cubit = CubitPy()
 
     # Create the mesh.
     solid = create_brick(cubit, 1, 1, 1, mesh_interval=[1, 1, 1])
@@ -936,9 +926,8 @@ def test_contact_condition_beam_to_surface():
     compare_yaml(cubit)
 
 
-def test_contact_condition_curve_to_curve():
+def test_contact_condition_curve_to_curve(cubit):
     """Test the curve-to-curve contact condition BC."""
-    cubit = CubitPy()
 
     # Create and mesh two rectangles
     cubit.cmd("create surface rectangle width 1 height 1 zplane")
@@ -986,9 +975,8 @@ def test_contact_condition_curve_to_curve():
     compare_yaml(cubit)
 
 
-def test_contact_condition_surface_to_surface():
+def test_contact_condition_surface_to_surface(cubit):
     """Test the surface-to-surface contact condition BC."""
-    cubit = CubitPy()
 
     # Create the mesh.
     solid = create_brick(cubit, 1, 1, 1, mesh_interval=[1, 1, 1])
@@ -1016,10 +1004,9 @@ def test_contact_condition_surface_to_surface():
 @pytest.mark.xfail(
     reason="This test fails due to mismatching results on macOS and Linux"
 )
-def test_fluid_functionality():
+def test_fluid_functionality(cubit):
     """Test fluid conditions and fluid mesh creation."""
 
-    cubit = CubitPy()
     fluid = create_brick(
         cubit,
         1,
@@ -1048,10 +1035,9 @@ def test_fluid_functionality():
     compare_yaml(cubit, additional_identifier=CUBIT_VERSION_TESTING_IDENTIFIER)
 
 
-def test_thermo_functionality():
+def test_thermo_functionality(cubit):
     """Test thermo mesh creation."""
 
-    cubit = CubitPy()
     create_brick(
         cubit,
         1,
@@ -1065,10 +1051,9 @@ def test_thermo_functionality():
     compare_yaml(cubit)
 
 
-def test_scatra_functionality():
+def test_scatra_functionality(cubit):
     """Test scatra mesh creation."""
 
-    cubit = CubitPy()
     thermo = create_brick(
         cubit,
         1,
@@ -1082,11 +1067,9 @@ def test_scatra_functionality():
     compare_yaml(cubit)
 
 
-def test_fsi_functionality():
+def test_fsi_functionality(cubit):
     """Test fsi and ale conditions and fluid mesh creation."""
 
-    cubit = CubitPy()
-
     # Create solif and fluid meshes
     solid = create_brick(cubit, 1, 1, 1, mesh_interval=[1, 1, 1])
     fluid = create_brick(
@@ -1116,23 +1099,29 @@ def test_fsi_functionality():
         fluid.surfaces()[3],
         name="ale_dirichlet_side",
         bc_type=cupy.bc_type.ale_dirichlet,
-        bc_description={
-            "NUMDOF": 3,
-            "ONOFF": [1, 1, 1],
-            "VAL": [0, 0, 0],
-            "FUNCT": [0, 0, 0],
-        },
+        bc_description=BC_DESCRIPTION_ZERO_3,
     )
 
     # Compare the input file created for 4C.
     compare_yaml(cubit)
 
 
-def test_point_coupling():
+def get_coincident_pairs(coordinates_1, coordinates_2):
+    """Return the index pairs of points in the two coordinate arrays that are
+    at the same position.
+
+    The pairs are ordered by the index in the first array. Squared
+    distances are compared, so no square roots have to be evaluated.
+    """
+    difference = coordinates_1[:, np.newaxis, :] - coordinates_2[np.newaxis, :, :]
+    distances_squared = np.einsum("ijk,ijk->ij", difference, difference)
+    return zip(*np.nonzero(distances_squared < EPS_POS_SQUARED))
+
+
+def test_point_coupling(cubit):
     """Create node-node and vertex-vertex coupling."""
 
     # First create two blocks.
-    cubit = CubitPy()
     solid_1 = create_brick(cubit, 1, 1, 1, mesh_interval=[2, 2, 2], mesh=False)
     cubit.move(solid_1, [0.0, -0.5, 0.0])
     solid_2 = create_brick(cubit, 1, 2, 1, mesh_interval=[2, 4, 2], mesh=False)
@@ -1158,49 +1147,47 @@ def test_point_coupling():
     node_ids_2 = surf[1].get_node_ids()
     node_ids_2.sort()
 
-    for node_id_1 in node_ids_1:
-        coordinates_1 = np.array(cubit.get_nodal_coordinates(node_id_1))
-        for node_id_2 in surf[1].get_node_ids():
-            coordinates_2 = cubit.get_nodal_coordinates(node_id_2)
-            if np.linalg.norm(coordinates_2 - coordinates_1) < cupy.eps_pos:
-                cubit.add_node_set(
-                    cubit.group(
-                        add_value="add node {} {}".format(node_id_1, node_id_2)
-                    ),
-                    geometry_type=cupy.geometry.vertex,
-                    bc_type=cupy.bc_type.point_coupling,
-                    bc_description={
-                        "NUMDOF": 3,
-                        "ONOFF": [1, 1, 1],
-                    },
-                )
+    # Get the coordinates of all nodes on the two surfaces.
+    coordinates_1 = cubit.get_nodal_coordinates_bulk(node_ids_1)
+    coordinates_2 = cubit.get_nodal_coordinates_bulk(node_ids_2)
+    for i_1, i_2 in get_coincident_pairs(coordinates_1, coordinates_2):
+        cubit.add_node_set(
+            cubit.group(
+                add_value="add node {} {}".format(node_ids_1[i_1], node_ids_2[i_2])
+            ),
+            geometry_type=cupy.geometry.vertex,
+            bc_type=cupy.bc_type.point_coupling,
+            bc_description={
+                "NUMDOF": 3,
+                "ONOFF": [1, 1, 1],
+            },
+        )
 
     # Also add coupling explicitly to the on corners.
-    for point_1 in solid_1.vertices():
-        coordinates_1 = np.array(point_1.coordinates())
-        for point_2 in solid_2.vertices():
-            coordinates_2 = np.array(point_2.coordinates())
-            if np.linalg.norm(coordinates_2 - coordinates_1) < cupy.eps_pos:
-                # Here a group has to be created.
-                group = cubit.group()
-                group.add([point_1, point_2])
-                cubit.add_node_set(
-                    group,
-                    bc_type=cupy.bc_type.point_coupling,
-                    bc_description={
-                        "NUMDOF": 3,
-                        "ONOFF": [1, 2, 3],
-                    },
-                )
+    points_1 = solid_1.vertices()
+    points_2 = solid_2.vertices()
+    coordinates_1 = np.array([point.coordinates() for point in points_1])
+    coordinates_2 = np.array([point.coordinates() for point in points_2])
+    for i_1, i_2 in get_coincident_pairs(coordinates_1, coordinates_2):
+        # Here a group has to be created.
+        group = cubit.group()
+        group.add([points_1[i_1], points_2[i_2]])
+        cubit.add_node_set(
+            group,
+            bc_type=cupy.bc_type.point_coupling,
+            bc_description={
+                "NUMDOF": 3,
+                "ONOFF": [1, 2, 3],
+            },
+        )
 
     # Compare the input file created for 4C.
     compare_yaml(cubit)
 
 
-def test_group_of_surfaces():
+def test_group_of_surfaces(cubit):
     """Test the proper creation of a group of surfaces and assign them an
     element type."""
-    cubit = CubitPy()
 
     # create a rectangle and imprint it
     cubit.cmd("create surface rectangle width 1 height 2 zplane")
@@ -1234,7 +1221,7 @@ def test_group_of_surfaces():
 
 
 @pytest.mark.parametrize("group_with", ["volume", "hex"])
-def test_groups(group_with):
+def test_groups(cubit, group_with):
     """Test that groups are handled correctly when creating node sets and
     element blocks.
 
@@ -1249,7 +1236,6 @@ def test_groups(group_with):
         raise ValueError(f"Got unexpected argument group_with {group_with}")
 
     # Create a solid brick.
-    cubit = CubitPy()
     cubit.brick(4, 2, 1)
 
     # Add to group by string.
@@ -1302,12 +1288,7 @@ def test_groups(group_with):
     cubit.add_node_set(
         surface_fix,
         bc_type=cupy.bc_type.dirichlet,
-        bc_description={
-            "NUMDOF": 3,
-            "ONOFF": [1, 1, 1],
-            "VAL": [0, 0, 0],
-            "FUNCT": [0, 0, 0],
-        },
+        bc_description=BC_DESCRIPTION_ZERO_3,
     )
 
     cubit.add_node_set(
@@ -1334,24 +1315,14 @@ def test_groups(group_with):
         group_no_name,
         name="fix_surf_no_name_group",
         bc_type=cupy.bc_type.dirichlet,
-        bc_description={
-            "NUMDOF": 3,
-            "ONOFF": [1, 1, 1],
-            "VAL": [0, 0, 0],
-            "FUNCT": [0, 0, 0],
-        },
+        bc_description=BC_DESCRIPTION_ZERO_3,
     )
     cubit.add_node_set(
         group_explicit_type,
         name="fix_group_explicit_type",
         geometry_type=cupy.geometry.vertex,
         bc_type=cupy.bc_type.dirichlet,
-        bc_description={
-            "NUMDOF": 3,
-            "ONOFF": [1, 1, 1],
-            "VAL": [0, 0, 0],
-            "FUNCT": [0, 0, 0],
-        },
+        bc_description=BC_DESCRIPTION_ZERO_3,
     )
 
     # Mesh the model.
@@ -1377,12 +1348,7 @@ def test_groups(group_with):
         mesh_group,
         geometry_type=cupy.geometry.vertex,
         bc_type=cupy.bc_type.dirichlet,
-        bc_description={
-            "NUMDOF": 3,
-            "ONOFF": [1, 1, 1],
-            "VAL": [0, 0, 0],
-            "FUNCT": [0, 0, 0],
-        },
+        bc_description=BC_DESCRIPTION_ZERO_3,
     )
 
     cubit.fourc_input["MATERIALS"] = [
@@ -1401,14 +1367,13 @@ def test_groups(group_with):
 
 
 @pytest.mark.parametrize("group_get_by", [None, "name", "id"])
-def test_groups_multiple_sets(group_get_by):
+def test_groups_multiple_sets(cubit, group_get_by):
     """Test that multiple sets can be created from a single group object.
 
     Also test that a group can be obtained by name and id.
     """
 
     # Create a solid brick.
-    cubit = CubitPy()
     cubit.brick(4, 2, 1)
 
     # Add to group by string.
@@ -1427,34 +1392,31 @@ def test_groups_multiple_sets(group_get_by):
         assert volume._id == volume_old._id
         assert volume.name == volume_old.name
 
-    # Add BCs.
-    cubit.add_node_set(
-        volume,
-        bc_type=cupy.bc_type.dirichlet,
-        bc_description={
-            "NUMDOF": 3,
-            "ONOFF": [1, 1, 1],
-            "VAL": [0, 0, 0],
-            "FUNCT": [0, 0, 0],
-        },
-    )
-    cubit.add_node_set(
-        volume,
-        bc_type=cupy.bc_type.neumann,
-        bc_description={
-            "NUMDOF": 3,
-            "ONOFF": [0, 0, 1],
-            "VAL": [0, 0, 1],
-            "FUNCT": [0, 0, 0],
-        },
-    )
+    # The following commands are sent without waiting for each of them.
+    with cubit.pipeline():
+        # Add BCs.
+        cubit.add_node_set(
+            volume,
+            bc_type=cupy.bc_type.dirichlet,
+            bc_description=BC_DESCRIPTION_ZERO_3,
+        )
+        cubit.add_node_set(
+            volume,
+            bc_type=cupy.bc_type.neumann,
+            bc_description={
+                "NUMDOF": 3,
+                "ONOFF": [0, 0, 1],
+                "VAL": [0, 0, 1],
+                "FUNCT": [0, 0, 0],
+            },
+        )
 
-    # Add blocks.
-    cubit.add_element_type(volume, cupy.element_type.hex8)
+        # Add blocks.
+        cubit.add_element_type(volume, cupy.element_type.hex8)
 
-    # Mesh the model.
-    cubit.cmd("{} size auto factor 8".format(formatter(volume)))
-    cubit.cmd("mesh {}".format(formatter(volume)))
+        # Mesh the model.
+        cubit.cmd("{} size auto factor 8".format(formatter(volume)))
+        cubit.cmd("mesh {}".format(formatter(volume)))
 
     cubit.fourc_input["MATERIALS"] = [
         {
@@ -1470,17 +1432,20 @@ def test_groups_multiple_sets(group_get_by):
     compare_yaml(cubit)
 
 
-def test_reset_block():
+def test_reset_block(cubit):
     """Test that the block counter can be reset in cubit."""
 
     # Create a solid brick.
-    cubit = CubitPy()
     block_1 = cubit.brick(1, 1, 1)
     block_2 = cubit.brick(2, 0.5, 0.5)
-    cubit.cmd("volume 1 size auto factor 10")
-    cubit.cmd("volume 2 size auto factor 10")
-    cubit.cmd("mesh volume 1")
-    cubit.cmd("mesh volume 2")
+    cubit.cmd_batch(
+        [
+            "volume 1 size auto factor 10",
+            "volume 2 size auto factor 10",
+            "mesh volume 1",
+            "mesh volume 2",
+        ]
+    )
 
     cubit.add_element_type(block_1.volumes()[0], cupy.element_type.hex8)
     compare_yaml(cubit, additional_identifier="1")
@@ -1490,23 +1455,21 @@ def test_reset_block():
     compare_yaml(cubit, additional_identifier="2")
 
 
-def test_get_id_functions():
+def test_get_id_functions(cubit):
     """Test if the get_ids and get_items methods work as expected."""
 
-    cubit = CubitPy()
-
-    cubit.cmd("create vertex 0 0 0")
-    cubit.cmd("create curve location 0 0 0 location 1 1 1")
-    cubit.cmd("create surface circle radius 1 zplane")
-    cubit.cmd("brick x 1")
-
-    assert [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12] == cubit.get_ids(
-        cupy.geometry.vertex
-    )
-    assert [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14] == cubit.get_ids(
-        cupy.geometry.curve
+    cubit.cmd_batch(
+        [
+            "create vertex 0 0 0",
+            "create curve location 0 0 0 location 1 1 1",
+            "create surface circle radius 1 zplane",
+            "brick x 1",
+        ]
     )
-    assert [1, 2, 3, 4, 5, 6, 7] == cubit.get_ids(cupy.geometry.surface)
+
+    np.testing.assert_array_equal(cubit.get_ids(cupy.geometry.vertex), np.arange(1, 13))
+    np.testing.assert_array_equal(cubit.get_ids(cupy.geometry.curve), np.arange(1, 15))
+    np.testing.assert_array_equal(cubit.get_ids(cupy.geometry.surface), np.arange(1, 8))
     if cupy.is_coreform():
         ref_ids = [1, 2]
         assert [1, 2] == cubit.get_ids(cupy.geometry.volume)
@@ -1515,36 +1478,218 @@ def test_get_id_functions():
     assert ref_ids == cubit.get_ids(cupy.geometry.volume)
 
 
-def test_get_node_id_function():
+def test_get_node_id_function(cubit):
     """Test if the get_node_ids methods in the cubit objects work as
     expected."""
 
     # Create brick.
-    cubit = CubitPy()
     brick = create_brick(cubit, 1, 1, 1, mesh_interval=[2, 2, 2])
 
     # Compare volume, surface, curve and vertex nodes.
-    node_ids = brick.volumes()[0].get_node_ids()
-    node_ids.sort()
-    assert node_ids == list(range(1, 28))
+    node_ids = get_sorted_node_ids(
+        [
+            brick.volumes()[0],
+            brick.surfaces()[3],
+            brick.curves()[4],
+            brick.vertices()[7],
+        ]
+    )
+    np.testing.assert_array_equal(node_ids[0], np.arange(1, 28))
+    np.testing.assert_array_equal(node_ids[1], [4, 6, 7, 13, 15, 16, 19, 22, 23])
+    np.testing.assert_array_equal(node_ids[2], [10, 11, 12])
+    np.testing.assert_array_equal(node_ids[3], [15])
+
+    # The single object function gives the same results.
+    np.testing.assert_array_equal(
+        np.sort(brick.surfaces()[3].get_node_ids()), node_ids[1]
+    )
+
+
+def test_deferred_delete(cubit):
+    """Test that objects in the client are deleted together with the next call
+    after the corresponding objects in the host are deleted."""
+
+    cubit_connect = cubit.cubit.cubit_connect
+    cubit_connect.flush_deletes()
+    n_objects = cubit_connect.send_and_return(["get_object_count"])
+
+    body = cubit.brick(1, 1, 1)
+    vertices = body.vertices()
+    assert cubit_connect.send_and_return(["get_object_count"]) == n_objects + 9
+
+    # The objects are only marked for deletion, they are deleted in the client
+    # with the next call.
+    del body, vertices
+    assert len(cubit_connect._pending_deletes) == 9
+    assert cubit_connect.send_and_return(["get_object_count"]) == n_objects
+    assert cubit_connect._pending_deletes == []
+
+
+def test_deferred_delete_limit(cubit, monkeypatch):
+    """Test that objects marked for deletion are sent to the client once
+    their number reaches the limit."""
+
+    monkeypatch.setattr(cubit_wrapper_host, "_MAX_PENDING_DELETES", 4)
+
+    cubit_connect = cubit.cubit.cubit_connect
+    cubit_connect.flush_deletes()
+    n_objects = cubit_connect.send_and_return(["get_object_count"])
+
+    body = cubit.brick(1, 1, 1)
+    vertices = body.vertices()
+    del body, vertices
+    assert len(cubit_connect._pending_deletes) == 1
+    assert cubit_connect.send_and_return(["get_object_count"]) == n_objects
+    assert cubit_connect._pending_deletes == []
+
+
+def test_send_batch(cubit):
+    """Test that multiple dependent calls can be sent to cubit in a single
+    batch."""
+
+    brick = cubit.brick(1, 1, 1)
+
+    cubit_returns = cubit.cubit.cubit_connect.send_batch(
+        [
+            (brick, "volumes", []),
+            (cubit.cubit, "get_entities", ["vertex"]),
+            (None, "next_free_id", ["{0}"], [1]),
+            (cubit.cubit, "cmd", ["create vertex {0} 0 0"], [2]),
+        ]
+    )
+
+    assert cubit_returns[0] == [cubit.volume(1)]
+    assert cubit_returns[1] == list(range(1, 9))
+    assert cubit_returns[2] == 9
+    assert cubit.get_entities("vertex") == list(range(1, 10))
+    assert cubit.vertex(9).coordinates() == [9.0, 0.0, 0.0]
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(6.0).reshape(2, 3),
+        np.arange(24, dtype=np.int64).reshape(2, 3, 4),
+        np.array([-1, 0, 2**31 - 1], dtype=np.int32),
+        np.array([0.5, -1.25, 3.0], dtype=np.float32),
+        np.array([], dtype=np.float64),
+        np.zeros((0, 3)),
+        np.array(1.5),
+    ],
+)
+def test_numpy_array_round_trip(cubit, array):
+    """Test that numpy arrays are passed to cubit with the correct values and
+    shape."""
+
+    cubit_returns = cubit.cubit.cubit_connect.send_batch([(None, "to_json", [array])])
+    assert json.loads(cubit_returns[0]) == array.tolist()
+
+
+def test_cmd_batch(cubit):
+    """Test that multiple commands can be run with a single call."""
+
+    return_values = cubit.cmd_batch([f"create vertex {i} 0 0" for i in range(3)])
+    assert return_values == [True, True, True]
+    assert cubit.get_entities("vertex") == [1, 2, 3]
+
+    # The commands after a failing one are not run.
+    with pytest.raises(
+        RuntimeError,
+        match="ERROR: All dimensions must be nonzero and positive. Entered values are:",
+    ):
+        cubit.cmd_batch(["brick x -10", "create vertex 3 0 0"])
+    assert cubit.get_entities("vertex") == [1, 2, 3]
+
+
+def test_get_curve_tangents(cubit):
+    """Test that the batched curve tangents are the same as the ones obtained
+    for each curve individually."""
+
+    curves = cubit.brick(1, 2, 3).curves()
+    tangents = cubit.get_curve_tangents(curves, [0, 0, 0])
+    assert tangents.shape == (12, 3)
+    for curve, tangent in zip(curves, tangents):
+        np.testing.assert_allclose(tangent, curve.tangent([0, 0, 0]))
+
+
+def test_get_nodal_coordinates_bulk(cubit):
+    """Test that the coordinates of multiple nodes are returned by a single
+    call."""
+
+    cubit.brick(1, 2, 3)
+    cubit.cmd("volume 1 size 0.5")
+    cubit.cmd("mesh volume 1")
+
+    node_ids = [3, 1, 7]
+    coordinates = cubit.get_nodal_coordinates_bulk(node_ids)
+    assert coordinates.shape == (3, 3)
+    for node_id, coordinate in zip(node_ids, coordinates):
+        assert np.allclose(coordinate, cubit.get_nodal_coordinates(node_id))
+    assert cubit.get_nodal_coordinates_bulk([]).shape == (0, 3)
+
+
+def test_get_all_nodal_coordinates_and_connectivity(cubit):
+    """Test that the coordinates of all nodes and the connectivity of all
+    elements of a type are returned in the order of their IDs."""
+
+    cubit.cmd("create surface rectangle width 2 height 1 zplane")
+    cubit.cmd("surface 1 size 0.5")
+    cubit.cmd("mesh surface 1")
+
+    coordinates = cubit.get_all_nodal_coordinates()
+    assert coordinates.shape == (cubit.get_node_count(), 3)
+    for i, coordinate in enumerate(coordinates):
+        assert np.allclose(coordinate, cubit.get_nodal_coordinates(i + 1))
 
-    node_ids = brick.surfaces()[3].get_node_ids()
-    node_ids.sort()
-    assert node_ids == [4, 6, 7, 13, 15, 16, 19, 22, 23]
+    connectivity = cubit.get_all_connectivity("quad")
+    assert connectivity.dtype == np.int32
+    assert connectivity.shape == (cubit.get_quad_count(), 4)
+    for i, element in enumerate(connectivity):
+        assert list(element) == list(cubit.get_connectivity("quad", i + 1))
 
-    node_ids = brick.curves()[4].get_node_ids()
-    node_ids.sort()
-    assert node_ids == [10, 11, 12]
+    connectivity = cubit.get_all_connectivity("hex")
+    assert connectivity.dtype == np.int32
+    assert connectivity.shape == (0, 8)
+    assert cubit.get_all_connectivity("tri").shape == (0, 3)
 
-    node_ids = brick.vertices()[7].get_node_ids()
-    node_ids.sort()
-    assert node_ids == [15]
 
+def test_pipeline(cubit):
+    """Test that commands in a pipeline are executed in cubit and errors are
+    raised when leaving the pipeline."""
 
-def test_serialize_nested_lists():
+    cubit_connect = cubit.cubit.cubit_connect
+
+    with cubit_connect.pipeline():
+        for i in range(3):
+            assert cubit.cmd(f"create vertex {i} 0 0") is None
+    assert cubit.get_entities("vertex") == [1, 2, 3]
+
+    with pytest.raises(
+        RuntimeError,
+        match="ERROR: All dimensions must be nonzero and positive. Entered values are:",
+    ):
+        with cubit_connect.pipeline():
+            cubit.cmd("brick x -10")
+            cubit.cmd("create vertex 3 0 0")
+    assert cubit.get_entities("vertex") == [1, 2, 3, 4]
+
+
+def test_get_surface_centers_and_normals(cubit):
+    """Test that the batched surface centers and normals are the same as the
+    ones obtained for each surface individually."""
+
+    surfaces = cubit.brick(1, 2, 3).surfaces()
+    centers, normals = get_surface_centers_and_normals(surfaces)
+
+    for surf, center, normal in zip(surfaces, centers, normals):
+        center_ref = get_surface_center(surf)
+        assert np.allclose(center, center_ref)
+        assert np.allclose(normal, surf.normal_at(center_ref))
+
+
+def test_serialize_nested_lists(cubit):
     """Test that nested lists can be send to cubit correctly."""
 
-    cubit = CubitPy()
     block_1 = cubit.brick(1, 1, 0.25)
     block_2 = cubit.brick(0.5, 0.5, 0.5)
     subtracted_block = cubit.subtract([block_2], [block_1])
@@ -1556,35 +1701,39 @@ def test_serialize_nested_lists():
     compare_yaml(cubit)
 
 
-def test_serialize_geometry_types():
-    """Test that geometry types can be send to cubit correctly."""
+# Reference bounding boxes of test_serialize_geometry_types.
+VERTEX_BOUNDING_BOX_REF = np.array([1.0, 1.0, 0.0, 2.0, 2.0, 0.0, 3.0, 3.0, 0.0, 0.0])
+VERTEX_BOUNDING_BOX_REF.setflags(write=False)
+CURVE_BOUNDING_BOX_REF = np.array(
+    [-1.0, 1.0, 2.0, -1.0, 2.0, 3.0, -1.0, 3.0, 4.0, 5.385164807134504]
+)
+CURVE_BOUNDING_BOX_REF.setflags(write=False)
 
-    cubit = CubitPy()
+
+def test_serialize_geometry_types(cubit):
+    """Test that geometry types can be send to cubit correctly."""
 
     cubit.cmd("create vertex -1 -1 -1")
     cubit.cmd("create vertex 1 2 3")
     geo_id = cubit.get_last_id(cupy.geometry.vertex)
     bounding_box = cubit.get_bounding_box(cupy.geometry.vertex, geo_id)
-    bounding_box_ref = np.array([1.0, 1.0, 0.0, 2.0, 2.0, 0.0, 3.0, 3.0, 0.0, 0.0])
-    assert 0.0 == pytest.approx(np.linalg.norm(bounding_box - bounding_box_ref), 1e-10)
+    np.testing.assert_allclose(
+        bounding_box, VERTEX_BOUNDING_BOX_REF, rtol=0, atol=1e-10
+    )
 
     cubit.cmd("create curve vertex 1 2")
     geo_id = cubit.get_last_id(cupy.geometry.curve)
     bounding_box = cubit.get_bounding_box(cupy.geometry.curve, geo_id)
-    bounding_box_ref = np.array(
-        [-1.0, 1.0, 2.0, -1.0, 2.0, 3.0, -1.0, 3.0, 4.0, 5.385164807134504]
-    )
-    assert 0.0 == pytest.approx(np.linalg.norm(bounding_box - bounding_box_ref), 1e-10)
+    np.testing.assert_allclose(bounding_box, CURVE_BOUNDING_BOX_REF, rtol=0, atol=1e-10)
 
 
-def test_mesh_import():
+def test_mesh_import(cubit):
     """Test that the cubit class MeshImport works properly.
 
     Code mainly taken from:
     https://cubit.sandia.gov/public/13.2/help_manual/WebHelp/appendix/python/class_mesh_import.htm
     """
 
-    cubit = CubitPy()
     mi = cubit.MeshImport()
     mi.add_nodes(
         3,
@@ -1599,18 +1748,35 @@ def test_mesh_import():
     compare_yaml(cubit)
 
 
+# Reference journal of test_display_in_cubit.
+DISPLAY_IN_CUBIT_JOURNAL_REF = "\n".join(
+    [
+        'open "state.cub5"',
+        "label volume On",
+        "label surface On",
+        "label curve On",
+        "label vertex On",
+        "label hex On",
+        "label tet On",
+        "label face On",
+        "label tri On",
+        "label edge On",
+        "label node On",
+        "display",
+    ]
+)
+
+
 def test_display_in_cubit():
     """Call the display_in_cubit function without actually opening the graphic
     version of cubit.
 
-    Compare that the created journal file is correct.
+    Compare that the created journal file is correct. The used functions
+    are static, so no cubit session is required.
     """
 
-    cubit = CubitPy()
-    create_brick(cubit, 1, 1, 1, mesh_interval=[2, 2, 2])
-
     # Check the command for opening cubit in the display_in_cubit function.
-    assert cubit._get_display_in_cubit_command("coreform.exe", "journal.jou") == [
+    assert CubitPy._get_display_in_cubit_command("coreform.exe", "journal.jou") == [
         "coreform.exe",
         "-nojournal",
         "-information",
@@ -1618,7 +1784,7 @@ def test_display_in_cubit():
         "-input",
         "journal.jou",
     ]
-    assert cubit._get_display_in_cubit_command(
+    assert CubitPy._get_display_in_cubit_command(
         "coreform.exe", "journal.jou", add_quotes=True
     ) == [
         '"coreform.exe"',
@@ -1630,43 +1796,81 @@ def test_display_in_cubit():
     ]
 
     # Check the journal file which is created in the display_in_cubit function.
-    assert cubit._get_display_in_cubit_journal_text(
-        state_path="state.cub5",
-        labels=[
-            cupy.geometry.vertex,
-            cupy.geometry.curve,
-            cupy.geometry.surface,
-            cupy.geometry.volume,
-            cupy.finite_element_object.node,
-            cupy.finite_element_object.edge,
-            cupy.finite_element_object.face,
-            cupy.finite_element_object.triangle,
-            cupy.finite_element_object.hex,
-            cupy.finite_element_object.tet,
-        ],
-    ) == "\n".join(
-        [
-            'open "state.cub5"',
-            "label volume On",
-            "label surface On",
-            "label curve On",
-            "label vertex On",
-            "label hex On",
-            "label tet On",
-            "label face On",
-            "label tri On",
-            "label edge On",
-            "label node On",
-            "display",
-        ]
-    )
-
-
-def test_create_parametric_surface():
+    assert (
+        CubitPy._get_display_in_cubit_journal_text(
+            state_path="state.cub5",
+            labels=[
+                cupy.geometry.vertex,
+                cupy.geometry.curve,
+                cupy.geometry.surface,
+                cupy.geometry.volume,
+                cupy.finite_element_object.node,
+                cupy.finite_element_object.edge,
+                cupy.finite_element_object.face,
+                cupy.finite_element_object.triangle,
+                cupy.finite_element_object.hex,
+                cupy.finite_element_object.tet,
+            ],
+        )
+        == DISPLAY_IN_CUBIT_JOURNAL_REF
+    )
+
+
+def test_display_in_cubit_testing(cubit):
+    """Test that display_in_cubit in testing mode returns the journal text and
+    command without opening cubit."""
+
+    cubit.brick(1, 1, 1)
+    journal_text, cubit_command = cubit.display_in_cubit(
+        labels=[cupy.geometry.volume], delay=0.0, testing=True
+    )
+
+    temp_path = cubit._get_cubit_local_temp_dir()
+    state_path = temp_path / ("state.cub5" if cupy.is_coreform() else "state.cub")
+    assert journal_text == CubitPy._get_display_in_cubit_journal_text(
+        state_path, [cupy.geometry.volume]
+    )
+    assert cubit_command == CubitPy._get_display_in_cubit_command(
+        cupy.get_cubit_exe_path(),
+        temp_path / "open_state.jou",
+        add_quotes=cupy.is_remote(),
+    )
+
+
+# Reference mesh of test_create_parametric_surface.
+# fmt: off
+PARAMETRIC_SURFACE_COORDINATES_REF = np.array([
+    [-1.0, -1.0, -1.118726301054815],
+    [-1.0, 1.0, -1.118726301054815],
+    [-1.0, 0.0, -0.5670890680965828],
+    [1.0, 1.0, 2.4154518351383505],
+    [-0.29336121659426423, 1.0, 0.037372888869339725],
+    [0.2933612165942643, 1.0, 1.2593526452141954],
+    [1.0, -1.0, 2.4154518351383505],
+    [1.0, 0.0, 2.9670890680965822],
+    [-0.29336121659426406, -1.0, 0.03737288886933997],
+    [0.2933612165942643, -1.0, 1.2593526452141954],
+    [-0.29336121659426406, -8.872129520034311e-17, 0.5890101218275721],
+    [0.2933612165942643, 8.060694322846754e-19, 1.810989878172428]
+])
+
+PARAMETRIC_SURFACE_CONNECTIVITY_REF = np.array([
+    [ 1,  3, 11,  9],
+    [ 3,  2,  5, 11],
+    [ 9, 11, 12, 10],
+    [11,  5,  6, 12],
+    [10, 12,  8,  7],
+    [12,  6,  4,  8]
+], dtype=np.int32)
+# fmt: on
+PARAMETRIC_SURFACE_COORDINATES_REF.setflags(write=False)
+PARAMETRIC_SURFACE_CONNECTIVITY_REF.setflags(write=False)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_create_parametric_surface(cubit, vectorized):
     """Test the create_parametric_surface function."""
 
-    cubit = CubitPy()
-
     def f(u, v, arg, kwarg=-1.0):
         """Parametric function to create the curve."""
         return [u, v, arg * np.sin(u) + kwarg * np.cos(v)]
@@ -1678,50 +1882,47 @@ def test_create_parametric_surface():
         n_segments=[3, 2],
         function_args=[2.1],
         function_kwargs={"kwarg": 1.2},
+        vectorized=vectorized,
     )
 
     cubit.cmd("{} size auto factor 9".format(formatter(surface)))
     surface.mesh()
 
-    coordinates = [
-        cubit.get_nodal_coordinates(i + 1) for i in range(cubit.get_node_count())
-    ]
-    connectivity = [
-        cubit.get_connectivity("quad", i + 1) for i in range(cubit.get_quad_count())
-    ]
+    coordinates = cubit.get_all_nodal_coordinates()
+    connectivity = cubit.get_all_connectivity("quad")
 
-    # fmt: off
-    coordinates_ref = np.array([
-        [-1.0, -1.0, -1.118726301054815],
-        [-1.0, 1.0, -1.118726301054815],
-        [-1.0, 0.0, -0.5670890680965828],
-        [1.0, 1.0, 2.4154518351383505],
-        [-0.29336121659426423, 1.0, 0.037372888869339725],
-        [0.2933612165942643, 1.0, 1.2593526452141954],
-        [1.0, -1.0, 2.4154518351383505],
-        [1.0, 0.0, 2.9670890680965822],
-        [-0.29336121659426406, -1.0, 0.03737288886933997],
-        [0.2933612165942643, -1.0, 1.2593526452141954],
-        [-0.29336121659426406, -8.872129520034311e-17, 0.5890101218275721],
-        [0.2933612165942643, 8.060694322846754e-19, 1.810989878172428]
-        ])
-
-    connectivity_ref = np.array([[ 1,  3, 11,  9],
-            [ 3,  2,  5, 11],
-            [ 9, 11, 12, 10],
-            [11,  5,  6, 12],
-            [10, 12,  8,  7],
-            [12,  6,  4,  8]])
-    # fmt: on
-
-    assert 0.0 == pytest.approx(np.linalg.norm(coordinates - coordinates_ref), 1e-12)
-    assert np.linalg.norm(connectivity - connectivity_ref) == 0
-
-
-def test_spline_interpolation_curve():
-    """Test the create_spline_interpolation_curve function."""
+    np.testing.assert_allclose(
+        coordinates, PARAMETRIC_SURFACE_COORDINATES_REF, rtol=0, atol=1e-12
+    )
+    np.testing.assert_array_equal(connectivity, PARAMETRIC_SURFACE_CONNECTIVITY_REF)
+
+
+# Reference mesh of test_spline_interpolation_curve.
+# fmt: off
+SPLINE_INTERPOLATION_CURVE_COORDINATES_REF = np.array([
+    [0.0, 1.0, 0.0],
+    [6.283185307179586, 1.0, -2.4492935982947064e-16],
+    [0.6219064247387815, 0.7622034923056742, 0.5808964193893371],
+    [1.2706376409420117, 0.30926608007524203, 0.9532391827102926],
+    [1.8922964421051867, -0.3108980458371118, 0.946952808381383],
+    [2.5151234800888007, -0.8099976142632724, 0.5846200862869367],
+    [3.1415926535897927, -0.9999999999999998, 1.6653345369377348e-16],
+    [3.7680618270907873, -0.8099976142632712, -0.5846200862869384],
+    [4.3908888650744, -0.31089804583711017, -0.9469528083813835],
+    [5.012547666237575, 0.30926608007524364, -0.9532391827102922],
+    [5.661278882440805, 0.7622034923056742, -0.5808964193893369]
+])
+
+SPLINE_INTERPOLATION_CURVE_CONNECTIVITY_REF = np.array([
+    [1, 3], [3, 4], [4, 5], [5, 6], [6, 7], [7, 8], [8, 9], [9, 10], [10, 11], [11, 2]
+], dtype=np.int32)
+# fmt: on
+SPLINE_INTERPOLATION_CURVE_COORDINATES_REF.setflags(write=False)
+SPLINE_INTERPOLATION_CURVE_CONNECTIVITY_REF.setflags(write=False)
 
-    cubit = CubitPy()
+
+def test_spline_interpolation_curve(cubit):
+    """Test the create_spline_interpolation_curve function."""
 
     x = np.linspace(0, 2 * np.pi, 7)
     y = np.cos(x)
@@ -1731,43 +1932,21 @@ def test_spline_interpolation_curve():
     curve = create_spline_interpolation_curve(cubit, vertices)
     curve.mesh()
 
-    coordinates = [
-        cubit.get_nodal_coordinates(i + 1) for i in range(cubit.get_node_count())
-    ]
-    connectivity = [
-        cubit.get_connectivity("edge", i + 1) for i in range(cubit.get_edge_count())
-    ]
+    coordinates = cubit.get_all_nodal_coordinates()
+    connectivity = cubit.get_all_connectivity("edge")
+
+    np.testing.assert_allclose(
+        coordinates, SPLINE_INTERPOLATION_CURVE_COORDINATES_REF, rtol=0, atol=1e-12
+    )
+    np.testing.assert_array_equal(
+        connectivity, SPLINE_INTERPOLATION_CURVE_CONNECTIVITY_REF
+    )
+
 
-    # fmt: off
-    coordinates_ref = np.array([
-        [0.0, 1.0, 0.0],
-        [6.283185307179586, 1.0, -2.4492935982947064e-16],
-        [0.6219064247387815, 0.7622034923056742, 0.5808964193893371],
-        [1.2706376409420117, 0.30926608007524203, 0.9532391827102926],
-        [1.8922964421051867, -0.3108980458371118, 0.946952808381383],
-        [2.5151234800888007, -0.8099976142632724, 0.5846200862869367],
-        [3.1415926535897927, -0.9999999999999998, 1.6653345369377348e-16],
-        [3.7680618270907873, -0.8099976142632712, -0.5846200862869384],
-        [4.3908888650744, -0.31089804583711017, -0.9469528083813835],
-        [5.012547666237575, 0.30926608007524364, -0.9532391827102922],
-        [5.661278882440805, 0.7622034923056742, -0.5808964193893369]
-    ])
-
-    connectivity_ref = np.array([[1, 3], [3, 4], [4, 5], [5, 6], [6, 7], [7, 8], [8, 9], [9, 10],
-        [10, 11], [11, 2]])
-    # fmt: on
-
-    assert 0.0 == pytest.approx(np.linalg.norm(coordinates - coordinates_ref), 1e-12)
-    assert np.linalg.norm(connectivity - connectivity_ref) == 0
-
-
-def test_create_brick_by_corner_points():
+def test_create_brick_by_corner_points(cubit):
     """Test the create_brick_by_corner_points and create_surface_by_vertices
     functions."""
 
-    # Set up Cubit.
-    cubit = CubitPy()
-
     # Create the brick
     corner_points = np.array(
         [
@@ -1799,7 +1978,7 @@ def test_create_brick_by_corner_points():
 
 
 def setup_and_check_import_fluent_geometry(
-    fluent_geometry, feature_angle, reference_entities_number
+    cubit, fluent_geometry, feature_angle, reference_entities_number
 ):
     """
     Test if cubit can import a geometry and:
@@ -1808,7 +1987,7 @@ def setup_and_check_import_fluent_geometry(
     """
 
     # Setup
-    cubit = CubitPy()
+    reset_cubit(cubit)
     import_fluent_geometry(cubit, fluent_geometry, feature_angle)
 
     # check if importation was successful
@@ -1820,27 +1999,24 @@ def setup_and_check_import_fluent_geometry(
     assert cubit.get_block_count() == reference_entities_number[2]
 
 
-def test_import_fluent_geometry():
+def test_import_fluent_geometry(cubit):
     """Test if an aneurysm geometry can be imported from a fluent mesh."""
 
     fluent_geometry = os.path.join(testing_external_geometry, "fluent_aneurysm.msh")
 
     # for a feature angle of 135, the imported geometry should consist of 1 volume, 7 surfaces and 1 block
-    setup_and_check_import_fluent_geometry(fluent_geometry, 135, [1, 7, 1])
+    setup_and_check_import_fluent_geometry(cubit, fluent_geometry, 135, [1, 7, 1])
 
     # for a feature angle of 100, the imported geometry should consist of 1 volume, 4 surfaces and 1 block
-    setup_and_check_import_fluent_geometry(fluent_geometry, 100, [1, 4, 1])
+    setup_and_check_import_fluent_geometry(cubit, fluent_geometry, 100, [1, 4, 1])
 
 
 @pytest.mark.xfail(
     reason="This test fails due to mismatching results on macOS and Linux"
 )
-def test_extrude_artery_of_aneurysm():
+def test_extrude_artery_of_aneurysm(cubit):
     """Extrude an arterial surface based on an aneurysm test case."""
 
-    # Set up Cubit.
-    cubit = CubitPy()
-
     # Set path for geometry.
     fluent_geometry = os.path.join(testing_external_geometry, "fluent_aneurysm.msh")
 
@@ -1874,10 +2050,9 @@ def test_extrude_artery_of_aneurysm():
 
 
 @pytest.mark.parametrize(*PYTEST_PARAMETERIZE_EXO)
-def test_node_sets_without_boundary_condition(export_exo, name):
+def test_node_sets_without_boundary_condition(cubit, export_exo, name):
     """Test that node sets without boundary conditions work as expected."""
 
-    cubit = CubitPy()
     create_brick(cubit, 1, 2, 3, mesh_interval=[2, 3, 4])
 
     # Set two node sets with a boundary condition
@@ -1930,12 +2105,9 @@ def test_node_sets_without_boundary_condition(export_exo, name):
 
 
 @pytest.mark.parametrize(*PYTEST_PARAMETERIZE_EXO)
-def test_user_defined_node_set_and_block_ids(export_exo, name):
+def test_user_defined_node_set_and_block_ids(cubit, export_exo, name):
     """Test that user-defined node set and block IDs work as expected."""
 
-    # Set up Cubit.
-    cubit = CubitPy()
-
     # Initialize geometry
     cubit.cmd("brick x 1 y 1 z 1")
     cubit.cmd("brick x 5e-1 y 5e-1 z 5e-1")
@@ -2059,7 +2231,7 @@ def test_user_defined_node_set_and_block_ids(export_exo, name):
     compare_yaml(cubit, additional_identifier=name, mesh_in_exo=export_exo)
 
 
-def test_yaml_with_exo_export_fsi():
+def test_yaml_with_exo_export_fsi(cubit):
     """Test if exporting a yaml file with an exodus mesh works, even in fsi
     cases, where GEOMETRY sections for fluid and solid domains need to be
     exported."""
@@ -2078,8 +2250,6 @@ def test_yaml_with_exo_export_fsi():
     MeshCavityHeight = 32
     MeshInflowHeight = 7
 
-    cubit = CubitPy()
-
     ############
     # GEOMETRY #
     ############
@@ -2172,11 +2342,9 @@ def test_yaml_with_exo_export_fsi():
     compare_yaml(cubit, mesh_in_exo=True)
 
 
-def test_cmd_return():
+def test_cmd_return(cubit):
     """Test the cmd_return function of CubitPy."""
 
-    cubit = CubitPy()
-
     center = cubit.cmd_return("create vertex 0 0 0", cupy.geometry.vertex)
     assert center.get_geometry_type() == cupy.geometry.vertex
     assert center.id() == 1
@@ -2226,10 +2394,9 @@ def test_cmd_return():
     assert [item.id() for item in sweep_geometry[cupy.geometry.volume]] == [1]
 
 
-def test_dump_numpy_array():
+def test_dump_numpy_array(cubit):
     """Check that numpy arrays can be used for boundary conditions."""
 
-    cubit = CubitPy()
     block = create_brick(cubit, 1, 2, 3, mesh_interval=[1, 1, 1])
 
     # Add boundary condition with numpy values
@@ -2247,10 +2414,9 @@ def test_dump_numpy_array():
     compare_yaml(cubit)
 
 
-def test_cubit_pass_array():
+def test_cubit_pass_array(cubit):
     """Check that different array types can be passed to cubit objects."""
 
-    cubit = CubitPy()
     block = create_brick(cubit, 1, 2, 3, mesh_interval=[1, 1, 1])
 
     point_and_result = [
@@ -2267,6 +2433,9 @@ def test_cubit_pass_array():
         #
         (np.array([1, 2, 3], dtype=int), False),
         (np.array([0, 0, 0], dtype=int), True),
+        #
+        ([np.float64(1.0), np.int64(2), np.float32(3.0)], False),
+        ([np.float64(0.4), np.int32(0), np.float32(1.4)], True),
     ]
 
     for point, result in point_and_result:
@@ -2274,10 +2443,9 @@ def test_cubit_pass_array():
         assert is_inside == result
 
 
-def test_cubit_compare_items():
+def test_cubit_compare_items(cubit):
     """Test that two cubit items can be compared."""
 
-    cubit = CubitPy()
     brick = cubit.brick(1, 2, 3)
 
     assert brick == brick
@@ -2301,10 +2469,9 @@ def test_cubit_compare_items():
     assert not (brick == "test_string")
 
 
-def test_cubit_hash_items():
+def test_cubit_hash_items(cubit):
     """Test that cubit items can be used in sets and as dictionary keys."""
 
-    cubit = CubitPy()
     brick = cubit.brick(1, 2, 3)
 
     object_set = {brick, brick.surfaces()[0], brick.surfaces()[0], brick.volumes()[0]}
@@ -2325,11 +2492,9 @@ def test_cubit_hash_items():
     assert object_dict[brick.volumes()[0]] == "volume_1"
 
 
-def test_object_formatter():
+def test_object_formatter(cubit):
     """Check the object formatter."""
 
-    cubit = CubitPy()
-
     brick_1 = cubit.brick(1, 2, 3)
     brick_2 = cubit.brick(1, 2, 3)
 
@@ -2487,11 +2652,9 @@ def test_node_set_info_to_string_errors():
         string_to_node_set_info("abc")
 
 
-def test_cubit_warnings_and_errors():
+def test_cubit_warnings_and_errors(cubit):
     """Test that cubit warnings and errors are handled correctly."""
 
-    cubit = CubitPy()
-
     # Warning
     cubit.cmd("brick x 10")
     with pytest.warns(CubitPyWarning, match="is a CUBIT identifier. Please use the"):
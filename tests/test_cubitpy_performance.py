@@ -28,7 +28,6 @@ import numpy as np
 import pytest
 
 from cubitpy.conf import cupy
-from cubitpy.cubitpy import CubitPy
 
 
 @pytest.fixture()
@@ -71,10 +70,9 @@ def benchmark_cubitpy(benchmark, request) -> Callable:
     return _benchmark_cubitpy
 
 
-def test_cubitpy_performance_object_creation(benchmark_cubitpy):
+def test_cubitpy_performance_object_creation(cubit, benchmark_cubitpy):
     """Check the performance of object creation."""
 
-    cubit = CubitPy()
     cubit.cmd("brick x 1 y 1 z 1")
 
     created_objects = []
@@ -87,11 +85,10 @@ def test_cubitpy_performance_object_creation(benchmark_cubitpy):
     )
 
 
-def test_cubitpy_performance_operations(benchmark_cubitpy):
+def test_cubitpy_performance_operations(cubit, benchmark_cubitpy):
     """Create a block and move it around numerous times to check the
     performance of the execnet connection."""
 
-    cubit = CubitPy()
     cubit.cmd("brick x 1 y 1 z 1")
     body = cubit.body(1)
     vector = np.array([0.01, 0.02, 0.03])
@@ -104,23 +101,26 @@ def test_cubitpy_performance_operations(benchmark_cubitpy):
     )
 
 
-def test_cubitpy_performance_receive_large_data(benchmark_cubitpy):
+def test_cubitpy_performance_receive_large_data(cubit, benchmark_cubitpy):
     """Check the performance of receiving large data from CubitPy."""
 
-    cubit = CubitPy()
+    def get_self_dir_uncached():
+        """Get the attributes of the cubit object from the client, the cached
+        result of previous calls is discarded before."""
+        cubit.cubit.cubit_connect.invalidate_introspection_cache()
+        return cubit.cubit.get_self_dir()
 
     benchmark_cubitpy(
-        cubit.cubit.get_self_dir,
+        get_self_dir_uncached,
         reference_times=[0.0065, 0.0082],
         rounds=10,
         iterations=100,
     )
 
 
-def test_cubitpy_performance_send_large_data(benchmark_cubitpy):
+def test_cubitpy_performance_send_large_data(cubit, benchmark_cubitpy):
     """Check the performance of sending large data to CubitPy."""
 
-    cubit = CubitPy()
     large_string = "a" * 1_000
 
     benchmark_cubitpy(